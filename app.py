@@ -4,12 +4,17 @@
 # Future Health Predictor - Unified Streamlit App with All Modules
 
 import streamlit as st
-import pandas as pd
-import joblib
+import atexit
 import os
 import random
+import time
 from fpdf import FPDF
 from datetime import datetime
+from model_manager import MANIFEST_PATH, ModelManager, manifest_model_paths
+from risk_rules import RULES, CUTOFFS, risk_band
+from live_scoring import IncrementalRuleScorer, IncrementalModelScorer
+from audit_log import AuditLogger
+from drift_monitor import DriftMonitor
 
 # ========== PDF Export Utility ==========
 def export_to_pdf(title, input_dict, insights, score_level):
@@ -44,6 +49,8 @@ MODEL_PATHS = {
     "Brain": "brain_model.pkl",
     # Others are simulated
 }
+# Versioned artifacts published by train_all.py take precedence when present
+MODEL_PATHS.update(manifest_model_paths(MANIFEST_PATH))
 
 # ========== Page Config ==========
 st.set_page_config(
@@ -55,23 +62,78 @@ st.title("🧠🦠 Future Health Predictor")
 st.markdown("Use your vitals to predict and prevent health risks across multiple body systems.")
 
 # ========== Model Loader ==========
-def load_model(system):
-    model_path = MODEL_PATHS.get(system)
-    if not model_path or not os.path.exists(model_path):
-        return None
-    return joblib.load(model_path)
+@st.cache_resource
+def get_model_manager():
+    # One watcher per server process; new artifacts are validated and swapped in
+    # by its background thread without restarting the app.
+    return ModelManager(MODEL_PATHS, manifest_path=MANIFEST_PATH).start()
+
+# Brain inputs the form actually collects; the rest are fixed defaults and
+# would always read as drift
+BRAIN_UI_FEATURES = ['Age', 'Sex', 'BP_Systolic', 'RestingHR', 'SpO2',
+                     'BlurredVision', 'FrequentHeadaches', 'FamilyHistoryBrainEvent']
+
+@st.cache_resource
+def get_drift_monitor(model_path, version):
+    # Keyed by artifact version, so a hot-reloaded model starts a fresh monitor
+    # against its own training-time reference sketches.
+    return DriftMonitor.from_model_path(model_path, features=BRAIN_UI_FEATURES)
+
+# ========== Audit Log ==========
+AUDIT_LOG_DIR = "audit_logs"
+
+@st.cache_resource
+def get_audit_logger():
+    logger = AuditLogger(AUDIT_LOG_DIR).start()
+    atexit.register(logger.close)
+    return logger
+
+def audit(system, inputs, prediction, started, probabilities=None, model_version="rules", **extra):
+    # Buffered in memory; a background thread writes it to the compressed log
+    logger = get_audit_logger()
+    logger.log(system, inputs, prediction, probabilities, model_version,
+               latency_ms=(time.perf_counter() - started) * 1000, **extra)
+    if logger.last_error:
+        st.warning(f"⚠️ Audit log is not being written ({logger.last_error}); "
+                   f"{logger.dropped:,} records dropped so far.")
+
+# ========== Live Scoring ==========
+# Scorers live in session state so live mode only re-evaluates what changed
+def rule_scorer(system):
+    key = f"rule_scorer_{system}"
+    if key not in st.session_state:
+        st.session_state[key] = IncrementalRuleScorer(RULES[system], CUTOFFS[system])
+    return st.session_state[key]
+
+def model_scorer(system, model):
+    key = f"model_scorer_{system}"
+    scorer = st.session_state.get(key)
+    if scorer is None or scorer.pipeline is not model:
+        # A hot-reloaded model invalidates the cached preprocessing
+        scorer = IncrementalModelScorer(model)
+        st.session_state[key] = scorer
+    return scorer
+
+def export_report(title, inputs, insights, risk):
+    # Live mode would rewrite the PDF on every slider move; export on request instead
+    if not live_mode:
+        export_to_pdf(title, inputs, insights, risk)
+    elif st.button("📄 Export PDF Report", key=f"export_{title}"):
+        export_to_pdf(title, inputs, insights, risk)
 
 # ========== Sidebar ==========
 system_choice = st.sidebar.selectbox(
     "Select Body System",
     ["Heart", "Brain", "Lungs", "Liver", "Kidney", "Diabetes"]
 )
-model = load_model(system_choice)
+live_mode = st.sidebar.toggle("⚡ Live mode", help="Update the risk level as you change inputs.")
 
 # Insert all modules here
+# Each module is a fragment, so widget changes rerun only that module, not the page.
 
 # ========== MODULE: BRAIN ==========
-if system_choice == "Brain":
+@st.fragment
+def brain_module():
     st.header("🧠 Advanced Brain Health & Neurological Risk Analyzer")
     st.markdown("_Combines vital signs, cognitive symptoms, and family history to detect potential neurological risks like stroke, cognitive decline, or neurodegenerative disease._")
 
@@ -88,8 +150,11 @@ if system_choice == "Brain":
     hr = st.slider("Heart Rate (bpm)", 40, 150, 75)
     spo2 = st.slider("Oxygen Saturation (%)", 85, 100, 96)
 
-    if st.button("🔍 Analyze Brain Health"):
-        df_input = pd.DataFrame([{
+    if live_mode or st.button("🔍 Analyze Brain Health"):
+        started = time.perf_counter()
+        current = get_model_manager().get("Brain")
+        model = current.model if current else None
+        patient = {
             'Age': age,
             'Sex': sex,
             'BP_Systolic': bp,
@@ -104,10 +169,17 @@ if system_choice == "Brain":
             'FrequentHeadaches': int(headache),
             'MobilityDizziness': 0,
             'FamilyHistoryBrainEvent': int(family_stroke)
-        }])
+        }
 
         if model:
-            prediction = model.predict(df_input)[0]
+            scorer = model_scorer("Brain", model)
+            proba = scorer.predict_proba(patient)
+            prediction = scorer.classes_[proba.argmax()]
+            audit("Brain", patient, prediction, started, dict(zip(scorer.classes_, proba)),
+                  f"{os.path.basename(current.path)}@{current.version[0]}")
+            monitor = get_drift_monitor(current.path, current.version)
+            if monitor:
+                monitor.observe(patient)
             if prediction == "NoRisk":
                 risk = "Low"
                 insights = [
@@ -128,17 +200,27 @@ if system_choice == "Brain":
                 ]
         else:
             risk = "Unknown"
-            insights = ["⚠️ Brain model not found. Please upload 'brain_model.pkl'."]
+            load_error = get_model_manager().errors.get("Brain")
+            if load_error:
+                insights = [f"⚠️ Brain model could not be loaded: {load_error}"]
+            else:
+                insights = ["⚠️ Brain model not found. Please upload 'brain_model.pkl'."]
 
         st.subheader(f"🧠 Predicted Brain Risk Level: {risk}")
         st.markdown("### 🧠 Why this result:")
         for i in insights:
             st.markdown(f"- {i}")
 
-        export_to_pdf("Brain", df_input.to_dict(orient='records')[0], insights, risk)
+        drifted = monitor.alerts() if model and monitor else {}
+        if drifted:
+            st.warning("📈 Recent inputs differ from the model's training data: " +
+                       ", ".join(f"{feature} (PSI {score:.2f})" for feature, score in sorted(drifted.items())))
+
+        export_report("Brain", patient, insights, risk)
 
 # ========== MODULE: HEART ==========
-if system_choice == "Heart":
+@st.fragment
+def heart_module():
     st.header("🫀 Advanced Cardiovascular Risk Analyzer")
     st.markdown("_Combines clinical tests and subjective symptoms to estimate heart disease risk._")
 
@@ -154,40 +236,31 @@ if system_choice == "Heart":
     oldpeak = st.slider("Oldpeak (ST depression)", 0.0, 6.0, 1.0)
     slope = st.radio("Slope of ST segment", ["Upsloping", "Flat", "Downsloping"])
 
-    if st.button("🔍 Analyze Heart Health"):
+    if live_mode or st.button("🔍 Analyze Heart Health"):
         inputs = {
             "Age": age, "Sex": sex, "Chest Pain": cp, "BP": bp, "Cholesterol": chol,
             "FBS > 120": fbs, "RestECG": restecg, "Heart Rate": hr,
             "Exercise Angina": exang, "Oldpeak": oldpeak, "ST Slope": slope
         }
 
-        score = 0
-        if cp in ["Typical Angina", "Atypical Angina"]: score += 2
-        if bp > 140: score += 1
-        if chol > 240: score += 1
-        if fbs: score += 1
-        if restecg != "Normal": score += 1
-        if hr < 60 or hr > 100: score += 1
-        if exang: score += 2
-        if oldpeak >= 2: score += 1
-        if slope == "Flat" or slope == "Downsloping": score += 1
-
-        if score <= 3:
-            risk = "Low"
+        started = time.perf_counter()
+        score = rule_scorer("Heart").update(inputs)
+        risk = risk_band(score, CUTOFFS["Heart"])
+        audit("Heart", inputs, risk, started, score=score)
+
+        if risk == "Low":
             insights = [
                 "Vitals show optimal ranges across all major cardiac indicators.",
                 "No chest pain or ECG abnormalities; heart rate is within normal sinus rhythm.",
                 "Patient displays healthy metabolic markers—minimal short-term cardiovascular threat."
             ]
-        elif score <= 6:
-            risk = "Moderate"
+        elif risk == "Moderate":
             insights = [
                 "Mild abnormalities in cholesterol, BP, or ECG indicate early dysfunction.",
                 "Symptoms suggest subclinical ischemia or early atherosclerotic changes.",
                 "Advise lifestyle modifications, lipid panel, stress echocardiogram for further clarity."
             ]
         else:
-            risk = "High"
             insights = [
                 "Multiple pathological findings detected including ECG anomalies, stress-induced angina, and metabolic strain.",
                 "High probability of myocardial ischemia or evolving coronary artery disease (CAD).",
@@ -199,10 +272,11 @@ if system_choice == "Heart":
         for i in insights:
             st.markdown(f"- {i}")
 
-        export_to_pdf("Heart", inputs, insights, risk)
+        export_report("Heart", inputs, insights, risk)
 
 # ========== MODULE: LUNGS ==========
-if system_choice == "Lungs":
+@st.fragment
+def lungs_module():
     st.header("🫁 Advanced Lung Health & Respiratory Risk Analyzer")
     st.markdown("_Combines symptoms and vital signs to detect potential respiratory concerns._")
 
@@ -218,32 +292,29 @@ if system_choice == "Lungs":
     resp_rate = st.slider("Respiratory Rate (breaths/min)", 10, 40, 16)
     hr = st.slider("Heart Rate (bpm)", 40, 140, 75)
 
-    if st.button("🔍 Analyze Lung Health"):
+    if live_mode or st.button("🔍 Analyze Lung Health"):
         inputs = {
             "Cough": cough, "Breathless": breathless, "Wheezing": wheeze,
             "Chest Tightness": chest_tight, "Fatigue": fatigue, "Smoker": smoker,
             "Pollutant Exposure": exposure, "SpO2": spo2, "Respiratory Rate": resp_rate, "Heart Rate": hr
         }
 
-        score = sum([cough, breathless, wheeze, chest_tight, fatigue, smoker, exposure])
-        if spo2 < 93: score += 2
-        if resp_rate > 20: score += 1
-        if hr > 100: score += 1
+        started = time.perf_counter()
+        score = rule_scorer("Lungs").update(inputs)
+        risk = risk_band(score, CUTOFFS["Lungs"])
+        audit("Lungs", inputs, risk, started, score=score)
 
-        if score <= 3:
-            risk = "Low"
+        if risk == "Low":
             insights = [
                 "Lung function appears stable. Normal oxygen levels and minimal symptoms.",
                 "No signs of significant respiratory stress or obstruction."
             ]
-        elif score <= 6:
-            risk = "Moderate"
+        elif risk == "Moderate":
             insights = [
                 "Some early respiratory indicators noted — e.g. mild cough, exposure, or increased breathing rate.",
                 "Could indicate chronic irritation or onset of asthma/bronchitis."
             ]
         else:
-            risk = "High"
             insights = [
                 "Multiple symptoms suggest obstructive or inflammatory lung disease.",
                 "SpO2 below normal and high respiratory rate indicate compromised oxygen exchange.",
@@ -255,10 +326,11 @@ if system_choice == "Lungs":
         for r in insights:
             st.markdown(f"- {r}")
 
-        export_to_pdf("Lungs", inputs, insights, risk)
+        export_report("Lungs", inputs, insights, risk)
 
 # ========== MODULE: LIVER ==========
-if system_choice == "Liver":
+@st.fragment
+def liver_module():
     st.header("🧬 Liver Function Risk Analyzer")
     st.markdown("_Assesses liver stress based on lab markers and symptoms._")
 
@@ -275,33 +347,30 @@ if system_choice == "Liver":
     bilirubin = st.slider("Bilirubin (mg/dL)", 0.0, 5.0, 0.8)
     albumin = st.slider("Albumin (g/dL)", 2.0, 5.5, 4.0)
 
-    if st.button("🔍 Analyze Liver Health"):
+    if live_mode or st.button("🔍 Analyze Liver Health"):
         inputs = {
             "Age": age, "Sex": sex, "Fatigue": fatigue, "Jaundice": jaundice,
             "Nausea": nausea, "Swelling": swelling, "Alcohol": alcohol,
             "ALT": alt, "AST": ast, "Bilirubin": bilirubin, "Albumin": albumin
         }
 
-        score = sum([fatigue, jaundice, nausea, swelling, alcohol])
-        if alt > 50 or ast > 50: score += 2
-        if bilirubin > 1.2: score += 2
-        if albumin < 3.5: score += 1
+        started = time.perf_counter()
+        score = rule_scorer("Liver").update(inputs)
+        risk = risk_band(score, CUTOFFS["Liver"])
+        audit("Liver", inputs, risk, started, score=score)
 
-        if score <= 3:
-            risk = "Low"
+        if risk == "Low":
             insights = [
                 "Liver enzyme levels are within safe limits.",
                 "No symptoms indicating hepatic dysfunction detected.",
                 "Healthy metabolic and protein synthesis profile."
             ]
-        elif score <= 6:
-            risk = "Moderate"
+        elif risk == "Moderate":
             insights = [
                 "Mild elevation in liver enzymes or early signs of hepatic stress.",
                 "May reflect fatty liver, alcohol impact, or early hepatitis."
             ]
         else:
-            risk = "High"
             insights = [
                 "Multiple elevated markers (ALT/AST/Bilirubin) and symptoms present.",
                 "Indicates high risk of liver inflammation or chronic liver disease.",
@@ -313,10 +382,11 @@ if system_choice == "Liver":
         for i in insights:
             st.markdown(f"- {i}")
 
-        export_to_pdf("Liver", inputs, insights, risk)
+        export_report("Liver", inputs, insights, risk)
 
 # ========== MODULE: KIDNEY ==========
-if system_choice == "Kidney":
+@st.fragment
+def kidney_module():
     st.header("🩺 Kidney Function & Risk Analyzer")
     st.markdown("_Detects early signs of renal dysfunction based on lab and symptom profiles._")
 
@@ -332,32 +402,29 @@ if system_choice == "Kidney":
     gfr = st.slider("Estimated GFR (mL/min/1.73m²)", 10, 120, 90)
     albuminuria = st.radio("Albumin in Urine?", ["Yes", "No"]) == "Yes"
 
-    if st.button("🔍 Analyze Kidney Health"):
+    if live_mode or st.button("🔍 Analyze Kidney Health"):
         inputs = {
             "Age": age, "Sex": sex, "Urination Issues": urinate,
             "Swelling": swelling, "Hematuria": blood_urine, "Fatigue": fatigue,
             "Creatinine": creatinine, "BUN": bun, "GFR": gfr, "Albuminuria": albuminuria
         }
 
-        score = sum([urinate, swelling, blood_urine, fatigue, albuminuria])
-        if creatinine > 1.3: score += 2
-        if bun > 30: score += 1
-        if gfr < 60: score += 2
+        started = time.perf_counter()
+        score = rule_scorer("Kidney").update(inputs)
+        risk = risk_band(score, CUTOFFS["Kidney"])
+        audit("Kidney", inputs, risk, started, score=score)
 
-        if score <= 3:
-            risk = "Low"
+        if risk == "Low":
             insights = [
                 "No signs of major renal dysfunction detected.",
                 "Normal GFR and creatinine support stable kidney filtration."
             ]
-        elif score <= 6:
-            risk = "Moderate"
+        elif risk == "Moderate":
             insights = [
                 "Mild elevations in waste markers or urine abnormalities.",
                 "Monitor for early nephropathy or glomerular stress."
             ]
         else:
-            risk = "High"
             insights = [
                 "Multiple risk factors detected: proteinuria, elevated creatinine, reduced GFR.",
                 "Suggestive of possible CKD (Chronic Kidney Disease).",
@@ -369,10 +436,11 @@ if system_choice == "Kidney":
         for i in insights:
             st.markdown(f"- {i}")
 
-        export_to_pdf("Kidney", inputs, insights, risk)
+        export_report("Kidney", inputs, insights, risk)
 
 # ========== MODULE: DIABETES ==========
-if system_choice == "Diabetes":
+@st.fragment
+def diabetes_module():
     st.header("🩸 Diabetes Risk & Glycemic Health Analyzer")
     st.markdown("_Combines early symptoms and blood markers to assess prediabetes or diabetes risk._")
 
@@ -388,32 +456,29 @@ if system_choice == "Diabetes":
     ppbs = st.slider("Postprandial Blood Sugar (mg/dL)", 100, 400, 160)
     hba1c = st.slider("HbA1c (%)", 4.5, 15.0, 6.0)
 
-    if st.button("🔍 Analyze Diabetes Risk"):
+    if live_mode or st.button("🔍 Analyze Diabetes Risk"):
         inputs = {
             "Age": age, "Sex": sex, "Thirst": thirsty, "Frequent Urination": frequent_urine,
             "Weight Loss": weight_loss, "Fatigue": tired, "Family History": family_history,
             "FBS": fbs, "PPBS": ppbs, "HbA1c": hba1c
         }
 
-        score = sum([thirsty, frequent_urine, weight_loss, tired, family_history])
-        if fbs > 126: score += 2
-        if ppbs > 200: score += 1
-        if hba1c >= 6.5: score += 2
+        started = time.perf_counter()
+        score = rule_scorer("Diabetes").update(inputs)
+        risk = risk_band(score, CUTOFFS["Diabetes"])
+        audit("Diabetes", inputs, risk, started, score=score)
 
-        if score <= 3:
-            risk = "Low"
+        if risk == "Low":
             insights = [
                 "Blood glucose readings are within normal range.",
                 "No persistent diabetic symptoms or family risk detected."
             ]
-        elif score <= 6:
-            risk = "Moderate"
+        elif risk == "Moderate":
             insights = [
                 "Some sugar markers suggest prediabetic state or early warning.",
                 "Combined with symptoms or family history, this indicates moderate risk."
             ]
         else:
-            risk = "High"
             insights = [
                 "Blood sugar levels and HbA1c are elevated.",
                 "Classic diabetic symptoms present — confirmatory tests strongly recommended.",
@@ -425,5 +490,15 @@ if system_choice == "Diabetes":
         for i in insights:
             st.markdown(f"- {i}")
 
-        export_to_pdf("Diabetes", inputs, insights, risk)
+        export_report("Diabetes", inputs, insights, risk)
 
+# ========== Module Dispatch ==========
+MODULES = {
+    "Heart": heart_module,
+    "Brain": brain_module,
+    "Lungs": lungs_module,
+    "Liver": liver_module,
+    "Kidney": kidney_module,
+    "Diabetes": diabetes_module,
+}
+MODULES[system_choice]()
@@ -2,6 +2,8 @@
 import pandas as pd
 import joblib
 import os
+from counterfactuals import print_counterfactuals
+from uncertainty import print_uncertainty, score_with_uncertainty
 
 # Load the trained model
 model_path = "timeline_model.pkl"
@@ -47,9 +49,10 @@ input_df = pd.DataFrame([{
 }])
 
 # Predict
-prediction = model.predict(input_df)[0]
-proba = model.predict_proba(input_df)[0]
-risk_confidence = dict(zip(model.classes_, proba))
+# One pass over the trees gives the label, the probabilities and the tree agreement
+scored = score_with_uncertainty(model, input_df)
+prediction = scored.prediction[0]
+risk_confidence = dict(zip(model.classes_, scored.proba[0]))
 
 # Output
 print("\nPrediction Summary:")
@@ -67,6 +70,9 @@ print("\nConfidence Levels:")
 for label, prob in risk_confidence.items():
     print(f"{label}: {prob*100:.2f}%")
 
+# How much the trees agree on this prediction
+print_uncertainty(model, scored)
+
 # Custom advice block
 print("\n🧠 Personalized Health Advice:")
 if prediction == "NoDisease":
@@ -111,4 +117,7 @@ elif prediction == "SuddenDeath":
 👨‍⚕️ Tell your doctor: "I’m getting a digital heart warning and need a full cardiac checkup."
 """)
 
+# Smallest lifestyle changes that lower the predicted risk
+print_counterfactuals(model, input_df.iloc[0].to_dict(), prediction)
+
 print("\n⚠️ This is a simulated prediction. For real conditions, consult your doctor.")
@@ -0,0 +1,236 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Append-only audit log of every assessment.
+#
+# log() only appends to an in-memory buffer; a background thread flushes the
+# buffer as a gzip member appended to the current segment file and rotates to a
+# new segment once it passes segment_bytes. Segment names carry the time of
+# their first record, so the reader can skip whole segments outside a time range.
+#
+#   python audit_log.py --since 2025-01-01 --system Brain
+
+import argparse
+import gzip
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+SEGMENT_PREFIX = "audit-"
+SEGMENT_SUFFIX = ".jsonl.gz"
+# Segment stamps are UTC, marked with a trailing Z; names without it come from
+# older writers that used local time
+TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S%fZ"
+LEGACY_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def parse_segment_name(name):
+    # audit-<first record time>-<writer pid>-<sequence>.jsonl.gz
+    stamp, writer, _ = name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)].split("-")
+    if not stamp.endswith("Z"):
+        return datetime.strptime(stamp, LEGACY_TIMESTAMP_FORMAT).timestamp(), writer
+    return datetime.strptime(stamp, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc).timestamp(), writer
+
+
+# ========== Writer ==========
+class AuditLogger:
+
+    # max_buffer wakes the flusher early; max_pending caps what is held in memory
+    # while writes keep failing. Records past the cap, or that cannot be
+    # serialized, are counted in `dropped`; `last_error` holds the most recent
+    # write failure until a flush succeeds again.
+
+    def __init__(self, log_dir="audit_logs", flush_interval=1.0, max_buffer=1000,
+                 segment_bytes=64 * 1024 * 1024, compresslevel=6, max_pending=100_000):
+        self.log_dir = log_dir
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.max_pending = max_pending
+        self.segment_bytes = segment_bytes
+        self.compresslevel = compresslevel
+        self.dropped = 0
+        self.last_error = None
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._segment = None
+        self._sequence = 0
+        self._thread = None
+        os.makedirs(log_dir, exist_ok=True)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="audit-log-flusher", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def log(self, system, inputs, prediction, probabilities=None, model_version=None, latency_ms=None, **extra):
+        record = {
+            "system": system,
+            "ts": time.time(),
+            "model_version": model_version,
+            "prediction": prediction,
+            "probabilities": probabilities,
+            "latency_ms": latency_ms,
+            "inputs": inputs,
+        }
+        record.update(extra)
+        with self._buffer_lock:
+            if len(self._buffer) >= self.max_pending:
+                self.dropped += 1
+                return
+            self._buffer.append(record)
+            full = len(self._buffer) >= self.max_buffer
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        # The write lock keeps concurrent flushes in buffer order; log() only
+        # takes the buffer lock, so callers never wait on serialization or I/O.
+        with self._write_lock:
+            with self._buffer_lock:
+                records, self._buffer = self._buffer, []
+            if not records:
+                return 0
+
+            lines, kept = [], []
+            for record in records:
+                try:
+                    lines.append(json.dumps(record, separators=(",", ":"), default=_json_default))
+                    kept.append(record)
+                except (TypeError, ValueError):
+                    with self._buffer_lock:
+                        self.dropped += 1
+            if not lines:
+                return 0
+            payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+            try:
+                if self._segment is None or os.path.getsize(self._segment) >= self.segment_bytes:
+                    self._segment = self._new_segment(kept[0]["ts"])
+                with gzip.open(self._segment, "ab", compresslevel=self.compresslevel) as f:
+                    f.write(payload)
+            except Exception as e:
+                # A partly written member may end the segment; retry into a new one.
+                # The batch goes back in front of anything logged since.
+                self._segment = None
+                with self._buffer_lock:
+                    self._buffer = kept + self._buffer
+                    overflow = len(self._buffer) - self.max_pending
+                    if overflow > 0:
+                        del self._buffer[:overflow]
+                        self.dropped += overflow
+                self.last_error = f"{type(e).__name__}: {e}"
+                raise
+            self.last_error = None
+        return len(lines)
+
+    def _new_segment(self, ts):
+        stamp = datetime.fromtimestamp(ts, timezone.utc).strftime(TIMESTAMP_FORMAT)
+        self._sequence += 1
+        name = f"{SEGMENT_PREFIX}{stamp}-{os.getpid()}-{self._sequence:04d}{SEGMENT_SUFFIX}"
+        return os.path.join(self.log_dir, name)
+
+    def _run(self):
+        # flush() keeps the batch and sets last_error on failure; the loop goes
+        # on and retries on the next interval
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+
+
+# ========== Reader ==========
+def list_segments(log_dir):
+    if not os.path.isdir(log_dir):
+        return []
+    names = [n for n in os.listdir(log_dir) if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX)]
+    return sorted(names, key=lambda n: (parse_segment_name(n)[0], n))
+
+
+def read_audit_log(log_dir="audit_logs", start=None, end=None, system=None, prediction=None):
+    # start/end are epoch seconds. Each writer's segments cover consecutive time
+    # ranges starting at the time in their name, so a segment is skipped unopened
+    # if it starts after `end` or the same writer's next segment starts before `start`.
+    names = list_segments(log_dir)
+    parsed = [parse_segment_name(n) for n in names]
+    next_start = {}
+    for i in reversed(range(len(names))):
+        seg_start, writer = parsed[i]
+        parsed[i] = (seg_start, next_start.get(writer))
+        next_start[writer] = seg_start
+    system_marker = f'"system":{json.dumps(system)}'.encode() if system else None
+
+    for name, (seg_start, seg_end) in zip(names, parsed):
+        if end is not None and seg_start > end:
+            break
+        if start is not None and seg_end is not None and seg_end < start:
+            continue
+        with gzip.open(os.path.join(log_dir, name), "rb") as f:
+            for line in f:
+                # Cheap byte check before paying for json.loads
+                if system_marker and system_marker not in line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if start is not None and record["ts"] < start:
+                    continue
+                if end is not None and record["ts"] > end:
+                    continue
+                if prediction is not None and record["prediction"] != prediction:
+                    continue
+                yield record
+
+
+def _parse_date(value):
+    return datetime.fromisoformat(value).timestamp()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scan the prediction audit log.")
+    parser.add_argument("--dir", default="audit_logs")
+    parser.add_argument("--since", type=_parse_date, help="ISO date/time, e.g. 2025-01-01")
+    parser.add_argument("--until", type=_parse_date, help="ISO date/time")
+    parser.add_argument("--system")
+    parser.add_argument("--prediction")
+    parser.add_argument("--show", type=int, default=0, help="print the first N matching records")
+    args = parser.parse_args()
+
+    counts = {}
+    for n, record in enumerate(read_audit_log(args.dir, args.since, args.until, args.system, args.prediction)):
+        if n < args.show:
+            print(json.dumps(record))
+        key = (record["system"], record["prediction"])
+        counts[key] = counts.get(key, 0) + 1
+
+    print("\n📋 Audit Summary:")
+    for (system, prediction), count in sorted(counts.items()):
+        print(f"{system:<10} {prediction:<15} {count:,}")
+    print(f"Total: {sum(counts.values()):,}")
@@ -2,9 +2,10 @@
 import pandas as pd
 import joblib
 import os
+from uncertainty import print_uncertainty, score_with_uncertainty
 
 # Load brain model
-model_path = "brain_model.pkl"
+model_path = "brain_model_v1.pkl"
 if not os.path.exists(model_path):
     raise FileNotFoundError(f"Model file '{model_path}' not found!")
 
@@ -53,9 +54,10 @@ input_df = pd.DataFrame([{
 }])
 
 # Predict
-prediction = model.predict(input_df)[0]
-proba = model.predict_proba(input_df)[0]
-confidence = dict(zip(model.classes_, proba))
+# One pass over the trees gives the label, the probabilities and the tree agreement
+scored = score_with_uncertainty(model, input_df)
+prediction = scored.prediction[0]
+confidence = dict(zip(model.classes_, scored.proba[0]))
 
 # Show result
 print("\nPrediction Result:")
@@ -70,6 +72,9 @@ print("\nConfidence Levels:")
 for k, v in confidence.items():
     print(f"{k}: {v*100:.2f}%")
 
+# How much the trees agree on this prediction
+print_uncertainty(model, scored)
+
 # Show personalized advice
 print("\n📋 Advice:")
 
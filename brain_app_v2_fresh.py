@@ -2,6 +2,8 @@
 import pandas as pd
 import joblib
 import os
+from counterfactuals import print_counterfactuals
+from uncertainty import print_uncertainty, score_with_uncertainty
 
 # Load brain model
 model_path = "brain_model.pkl"
@@ -59,9 +61,10 @@ input_df = pd.DataFrame([{
 }])
 
 # Predict
-prediction = model.predict(input_df)[0]
-proba = model.predict_proba(input_df)[0]
-confidence = dict(zip(model.classes_, proba))
+# One pass over the trees gives the label, the probabilities and the tree agreement
+scored = score_with_uncertainty(model, input_df)
+prediction = scored.prediction[0]
+confidence = dict(zip(model.classes_, scored.proba[0]))
 
 # Output
 print("\n📋 Risk Prediction:")
@@ -76,6 +79,9 @@ print("\nConfidence Levels:")
 for k, v in confidence.items():
     print(f"{k}: {v*100:.2f}%")
 
+# How much the trees agree on this prediction
+print_uncertainty(model, scored)
+
 # Advice
 print("\n🧠 Personalized Advice:")
 if prediction == "NoRisk":
@@ -120,4 +126,7 @@ Symptoms may include: Head pressure, vision issues, unstable walking
 ⚡ Early action saves lives. Don't wait!
 """)
 
+# Smallest lifestyle changes that lower the predicted risk
+print_counterfactuals(model, input_df.iloc[0].to_dict(), prediction)
+
 print("\n⚠️ This is an educational tool. Always consult a real doctor for diagnosis.")
@@ -0,0 +1,140 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Cascade triage for bulk brain screening: a vectorized rule stage resolves
+# clear-cut records from the clinical thresholds in train_brain_model_v2.py,
+# and only the ambiguous ones are sent to the RandomForest.
+#
+#   python cascade_scorer.py                    # synthetic cohort
+#   python cascade_scorer.py cohort.csv
+
+import argparse
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from dataset_cache import cached_dataset
+
+# How far past a label threshold a reading must be before the rule stage
+# trusts it; anything closer goes to the model.
+RULE_MARGINS = {
+    'BP_Systolic': 5,
+    'SpO2': 0.5,
+    'FastingBloodSugar': 5,
+    'RestingHR': 3,
+    'StressLevel': 1,
+    'BMI': 1.0,
+}
+
+STAGES = ["rule_emergency", "rule_norisk", "model"]
+
+
+def rule_stage(X, margins=RULE_MARGINS):
+    # Returns (emergency, norisk) boolean masks; rows in neither are ambiguous
+    m = margins
+    bp, spo2, fbs = X['BP_Systolic'].to_numpy(), X['SpO2'].to_numpy(), X['FastingBloodSugar'].to_numpy()
+    hr, stress, bmi = X['RestingHR'].to_numpy(), X['StressLevel'].to_numpy(), X['BMI'].to_numpy()
+    blurred, dizzy = X['BlurredVision'].to_numpy() == 1, X['MobilityDizziness'].to_numpy() == 1
+
+    emergency = (
+        (bp >= 170 + m['BP_Systolic']) |
+        (spo2 <= 93 - m['SpO2']) |
+        (fbs >= 160 + m['FastingBloodSugar']) |
+        (hr >= 100 + m['RestingHR']) |
+        (blurred & (stress >= 7 + m['StressLevel'])) |
+        (dizzy & (bmi >= 32 + m['BMI']))
+    )
+    norisk = (
+        (bp < 145 - m['BP_Systolic']) &
+        (spo2 > 93 + m['SpO2']) &
+        (fbs < 130 - m['FastingBloodSugar']) &
+        (hr < 100 - m['RestingHR']) &
+        (stress < 6 - m['StressLevel']) &
+        (bmi < 28 - m['BMI'])
+    )
+    return emergency, norisk & ~emergency
+
+
+class CascadeScorer:
+
+    def __init__(self, model, margins=RULE_MARGINS):
+        self.model = model
+        self.margins = margins
+        self.counters = dict.fromkeys(STAGES, 0)
+
+    def predict_with_stage(self, X, count=True):
+        emergency, norisk = rule_stage(X, self.margins)
+        labels = np.empty(len(X), dtype=object)
+        stages = np.full(len(X), "model", dtype=object)
+        labels[emergency], stages[emergency] = 'EmergencyRisk', "rule_emergency"
+        labels[norisk], stages[norisk] = 'NoRisk', "rule_norisk"
+
+        ambiguous = ~(emergency | norisk)
+        if ambiguous.any():
+            labels[ambiguous] = self.model.predict(X[ambiguous])
+
+        if count:
+            self.counters["rule_emergency"] += int(emergency.sum())
+            self.counters["rule_norisk"] += int(norisk.sum())
+            self.counters["model"] += int(ambiguous.sum())
+        return labels, stages
+
+    def predict(self, X):
+        return self.predict_with_stage(X)[0]
+
+    def traffic(self):
+        total = sum(self.counters.values())
+        return {stage: (count, count / total if total else 0.0) for stage, count in self.counters.items()}
+
+    def agreement(self, X):
+        # Agreement with the full model, overall and per stage that decided the row
+        full = self.model.predict(X)
+        labels, stages = self.predict_with_stage(X, count=False)
+        matches = labels == full
+        report = {"overall": float(matches.mean()) if len(X) else 1.0}
+        for stage in STAGES:
+            mask = stages == stage
+            if mask.any():
+                report[stage] = float(matches[mask].mean())
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the rule-then-forest cascade on a brain cohort.")
+    parser.add_argument("cohort", nargs="?", help="CSV with the brain model's feature columns")
+    parser.add_argument("--model", default="brain_model.pkl")
+    parser.add_argument("--rows", type=int, default=100_000, help="synthetic cohort size when no CSV is given")
+    args = parser.parse_args()
+
+    model = joblib.load(args.model)
+    if args.cohort:
+        X = pd.read_csv(args.cohort)
+    else:
+        from train_brain_model_v2 import generate_dataset
+        X, _ = cached_dataset(generate_dataset, num_samples=args.rows, seed=7)
+    X = X[list(model.feature_names_in_)]
+
+    start = time.perf_counter()
+    model.predict(X)
+    full_seconds = time.perf_counter() - start
+
+    cascade = CascadeScorer(model)
+    start = time.perf_counter()
+    cascade.predict(X)
+    cascade_seconds = time.perf_counter() - start
+    traffic = cascade.traffic()
+
+    print(f"\n🧮 Cascade triage on {len(X):,} records:")
+    for stage, (count, share) in traffic.items():
+        print(f"{stage:<15} {count:>10,}  ({share * 100:.1f}%)")
+    print(f"\nFull model: {full_seconds:.3f}s   Cascade: {cascade_seconds:.3f}s")
+
+    print("\nAgreement with full model:")
+    for stage, value in cascade.agreement(X).items():
+        print(f"{stage:<15} {value * 100:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
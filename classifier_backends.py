@@ -0,0 +1,101 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Interchangeable classifier backends for the training scripts, plus an
+# accuracy/latency leaderboard to pick one per body system.
+
+import os
+import tempfile
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+from sklearn.tree import DecisionTreeClassifier
+
+# ========== Backends ==========
+CLASSIFIER_BACKENDS = {
+    "random_forest": lambda seed: RandomForestClassifier(n_estimators=100, random_state=seed),
+    "hist_gradient_boosting": lambda seed: HistGradientBoostingClassifier(random_state=seed),
+    "logistic_regression": lambda seed: LogisticRegression(max_iter=1000),
+    "single_tree": lambda seed: DecisionTreeClassifier(max_depth=6, random_state=seed),
+}
+DEFAULT_BACKEND = "random_forest"
+
+
+def make_classifier(backend=DEFAULT_BACKEND, seed=42):
+    if backend not in CLASSIFIER_BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Choose from: {', '.join(CLASSIFIER_BACKENDS)}")
+    return CLASSIFIER_BACKENDS[backend](seed)
+
+
+def add_backend_arguments(parser):
+    parser.add_argument("--backend", choices=list(CLASSIFIER_BACKENDS), default=DEFAULT_BACKEND,
+                        help="classifier used for the saved model")
+    parser.add_argument("--leaderboard", action="store_true",
+                        help="train every backend on the same split and report accuracy/latency instead of saving a model")
+
+
+# ========== Leaderboard ==========
+def benchmark_pipeline(pipeline, X_test, y_test, latency_repeats=200, batch_rows=10_000):
+    accuracy = float((pipeline.predict(X_test) == np.asarray(y_test)).mean())
+
+    fd, path = tempfile.mkstemp(suffix=".pkl")
+    os.close(fd)
+    try:
+        joblib.dump(pipeline, path)
+        artifact_bytes = os.path.getsize(path)
+        start = time.perf_counter()
+        joblib.load(path)
+        load_seconds = time.perf_counter() - start
+    finally:
+        os.unlink(path)
+
+    # Single-row latency is measured end to end (DataFrame in, probabilities out),
+    # the way the apps call the model.
+    row = X_test.iloc[[0]]
+    pipeline.predict_proba(row)
+    timings = []
+    for _ in range(latency_repeats):
+        start = time.perf_counter()
+        pipeline.predict_proba(row)
+        timings.append(time.perf_counter() - start)
+
+    batch = X_test.sample(n=batch_rows, replace=True, random_state=0)
+    start = time.perf_counter()
+    pipeline.predict_proba(batch)
+    batch_seconds = time.perf_counter() - start
+
+    return {
+        "accuracy": accuracy,
+        "artifact_kb": artifact_bytes / 1024,
+        "load_ms": load_seconds * 1000,
+        "p50_row_ms": float(np.percentile(timings, 50)) * 1000,
+        "p95_row_ms": float(np.percentile(timings, 95)) * 1000,
+        "batch_rows_per_s": batch_rows / batch_seconds,
+    }
+
+
+def build_leaderboard(build_pipeline, X, y, backends=None, test_size=0.25, seed=42):
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=seed, stratify=y)
+    rows = []
+    for backend in backends or CLASSIFIER_BACKENDS:
+        pipeline = build_pipeline(backend)
+        start = time.perf_counter()
+        pipeline.fit(X_train, y_train)
+        fit_seconds = time.perf_counter() - start
+        result = {"backend": backend, "fit_s": fit_seconds}
+        result.update(benchmark_pipeline(pipeline, X_test, y_test))
+        rows.append(result)
+    return pd.DataFrame(rows).sort_values(["accuracy", "p50_row_ms"], ascending=[False, True]).reset_index(drop=True)
+
+
+def report_leaderboard(leaderboard, model_path):
+    print(leaderboard.to_string(index=False, float_format=lambda v: f"{v:,.3f}"))
+    path = os.path.splitext(model_path)[0] + "_leaderboard.csv"
+    leaderboard.to_csv(path, index=False)
+    print(f"📊 Leaderboard saved as {path}")
+    return path
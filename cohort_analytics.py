@@ -0,0 +1,139 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Cohort-level risk aggregates for the analytics dashboard.
+#
+# A scored cohort file has one row per assessment with the columns Age, Sex,
+# System and RiskLevel (Low/Moderate/High), and optionally a numeric Score.
+# It is reduced once to a small aggregate cube (age band x sex x system x risk
+# level), cached on disk by file hash; every drill-down is a roll-up of that cube.
+# Rows the cube cannot place (other risk labels, missing Age/Sex/System) are
+# counted in cube.attrs["dropped_rows"] rather than silently left out.
+#
+#   python cohort_analytics.py scored_cohort.csv     # precompute and cache
+
+import hashlib
+import os
+import sys
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from risk_rules import RISK_LEVELS
+
+CACHE_DIR = os.path.join(".cache", "cohort_aggregates")
+# Bump when the cube layout or bands change so stale caches are not reused
+AGGREGATE_VERSION = 2
+
+AGE_BINS = [0, 30, 40, 50, 60, 70, 80, np.inf]
+AGE_BANDS = ["<30", "30-39", "40-49", "50-59", "60-69", "70-79", "80+"]
+DIMENSIONS = ["AgeBand", "Sex", "System"]
+REQUIRED_COLUMNS = ["Age", "Sex", "System", "RiskLevel"]
+
+
+# ========== Loading ==========
+def file_hash(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_cohort(path):
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path)
+    else:
+        # Low-cardinality text columns as categoricals keep millions of rows compact
+        df = pd.read_csv(path, dtype={"Sex": "category", "System": "category", "RiskLevel": "category"})
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Scored cohort is missing columns: {', '.join(missing)}")
+    return df
+
+
+# ========== Aggregation ==========
+def compute_aggregates(df):
+    # Vectorized group-by down to the finest grain the dashboard can drill into
+    frame = pd.DataFrame({
+        "AgeBand": pd.cut(df["Age"], bins=AGE_BINS, labels=AGE_BANDS, right=False),
+        "Sex": df["Sex"].astype("category"),
+        "System": df["System"].astype("category"),
+        # Labels outside RISK_LEVELS become missing and are counted as dropped below
+        "RiskLevel": pd.Categorical(df["RiskLevel"].where(df["RiskLevel"].isin(RISK_LEVELS)), categories=RISK_LEVELS),
+        "Score": df["Score"] if "Score" in df.columns else np.nan,
+    })
+    cube = frame.groupby(DIMENSIONS + ["RiskLevel"], observed=True).agg(
+        Count=("RiskLevel", "size"),
+        ScoreSum=("Score", "sum"),
+    ).reset_index()
+    if "Score" not in df.columns:
+        cube["ScoreSum"] = np.nan
+
+    # group-by skips any row with a missing key; count them per column
+    unplaced = frame[DIMENSIONS + ["RiskLevel"]].isna().rename(columns={"AgeBand": "Age"})
+    cube.attrs["dropped_rows"] = int(unplaced.any(axis=1).sum())
+    cube.attrs["dropped_by_column"] = {c: int(n) for c, n in unplaced.sum().items() if n}
+    return cube
+
+
+def describe_dropped(cube):
+    # e.g. "1,204 rows not counted (RiskLevel: 1,200, Age: 4)"; None when nothing was dropped
+    dropped = cube.attrs.get("dropped_rows", 0)
+    if not dropped:
+        return None
+    reasons = ", ".join(f"{c}: {n:,}" for c, n in cube.attrs["dropped_by_column"].items())
+    return f"{dropped:,} rows not counted ({reasons})"
+
+
+def cache_path(digest):
+    return os.path.join(CACHE_DIR, f"v{AGGREGATE_VERSION}-{digest}.pkl")
+
+
+def load_aggregates(path, digest=None):
+    digest = digest or file_hash(path)
+    cached = cache_path(digest)
+    if os.path.exists(cached):
+        return joblib.load(cached)
+
+    cube = compute_aggregates(load_cohort(path))
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = cached + ".tmp"
+    joblib.dump(cube, tmp_path)
+    os.replace(tmp_path, cached)
+    return cube
+
+
+# ========== Roll-ups ==========
+def filter_cube(cube, **selected):
+    # selected maps a dimension to the values to keep; empty selections keep everything
+    mask = np.ones(len(cube), dtype=bool)
+    for dimension, values in selected.items():
+        if values:
+            mask &= cube[dimension].isin(values).to_numpy()
+    return cube[mask]
+
+
+def risk_distribution(cube, by):
+    # Rows: values of `by`; columns: count and share per risk level, plus mean score
+    counts = cube.pivot_table(index=by, columns="RiskLevel", values="Count", aggfunc="sum",
+                              fill_value=0, observed=True)
+    counts = counts.reindex(columns=RISK_LEVELS, fill_value=0)
+    table = counts.copy()
+    table["Total"] = counts.sum(axis=1)
+    for level in RISK_LEVELS:
+        table[f"{level} %"] = 100 * counts[level] / table["Total"].where(table["Total"] > 0)
+    score_sum = cube.groupby(by, observed=True)["ScoreSum"].sum(min_count=1)
+    table["Mean Score"] = score_sum.reindex(table.index) / table["Total"]
+    return table
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python cohort_analytics.py SCORED_COHORT")
+    cube = load_aggregates(sys.argv[1])
+    print(risk_distribution(cube, "System").to_string(float_format=lambda v: f"{v:,.1f}"))
+    print(f"\n✅ {int(cube['Count'].sum()):,} scored rows reduced to {len(cube):,} aggregate cells")
+    if describe_dropped(cube):
+        print(f"⚠️ {describe_dropped(cube)}: risk level outside {'/'.join(RISK_LEVELS)} or Age/Sex/System missing")
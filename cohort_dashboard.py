@@ -0,0 +1,75 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Future Health Predictor - Cohort Risk Analytics Dashboard
+#
+#   streamlit run cohort_dashboard.py
+
+import os
+
+import streamlit as st
+
+from cohort_analytics import (AGE_BANDS, DIMENSIONS, describe_dropped, file_hash, filter_cube, load_aggregates,
+                              risk_distribution)
+from risk_rules import RISK_LEVELS
+
+st.set_page_config(
+    page_title="Cohort Risk Analytics",
+    page_icon="📊",
+    layout="wide",
+)
+st.title("📊 Cohort Risk Analytics")
+st.markdown("Risk distributions across a scored population by age band, sex and body system.")
+
+# ========== Cached Loaders ==========
+@st.cache_data(show_spinner="Hashing cohort file...")
+def cached_file_hash(path, mtime_ns, size):
+    # mtime/size are part of the cache key so an edited file is re-hashed
+    return file_hash(path)
+
+@st.cache_data(show_spinner="Aggregating cohort...")
+def cached_aggregates(path, digest):
+    return load_aggregates(path, digest)
+
+# ========== Data Source ==========
+path = st.sidebar.text_input("Scored cohort file (CSV or Parquet)", "scored_cohort.csv")
+if not os.path.exists(path):
+    st.info(f"⚠️ '{path}' not found. Point the sidebar at a scored cohort with Age, Sex, System and RiskLevel columns.")
+    st.stop()
+
+stat = os.stat(path)
+cube = cached_aggregates(path, cached_file_hash(path, stat.st_mtime_ns, stat.st_size))
+if describe_dropped(cube):
+    st.warning(f"⚠️ {describe_dropped(cube)}. Only rows with a {'/'.join(RISK_LEVELS)} risk level and "
+               "Age, Sex and System filled in are included below.")
+
+# ========== Filters ==========
+systems = st.sidebar.multiselect("Body System", sorted(cube["System"].unique()))
+sexes = st.sidebar.multiselect("Sex", sorted(cube["Sex"].unique()))
+age_bands = st.sidebar.multiselect("Age Band", AGE_BANDS)
+view = filter_cube(cube, System=systems, Sex=sexes, AgeBand=age_bands)
+
+total = int(view["Count"].sum())
+counts = view.groupby("RiskLevel", observed=True)["Count"].sum().reindex(RISK_LEVELS, fill_value=0)
+columns = st.columns(len(RISK_LEVELS) + 1)
+columns[0].metric("Assessments", f"{total:,}")
+for column, level in zip(columns[1:], RISK_LEVELS):
+    share = 100 * counts[level] / total if total else 0
+    column.metric(f"{level} Risk", f"{share:.1f}%", f"{int(counts[level]):,}", delta_color="off")
+
+# ========== Breakdown ==========
+group_by = st.radio("Group by", DIMENSIONS, horizontal=True,
+                    format_func=lambda d: {"AgeBand": "Age Band"}.get(d, d))
+table = risk_distribution(view, group_by)
+st.bar_chart(table[[f"{level} %" for level in RISK_LEVELS]])
+st.dataframe(table.style.format(precision=1, thousands=","))
+
+# ========== Drill-Down ==========
+st.subheader("🔎 Drill-down")
+if len(table.index):
+    selected = st.selectbox(f"Select a {group_by}", list(table.index))
+    others = [d for d in DIMENSIONS if d != group_by]
+    drill = filter_cube(view, **{group_by: [selected]})
+    for dimension in others:
+        st.markdown(f"**{selected} by {dimension}**")
+        st.dataframe(risk_distribution(drill, dimension).style.format(precision=1, thousands=","))
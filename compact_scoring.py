@@ -0,0 +1,351 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Compact scoring path for the brain model: fixed-schema records in a numpy
+# struct array, direct float32 feature encoding, and the forest flattened into
+# float32/int16 node arrays. No per-patient dicts or DataFrames are created.
+#
+#   python compact_scoring.py --parity              # compare against the pipeline
+#   python compact_scoring.py --report --rows 1000000
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+import joblib
+import numpy as np
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from dataset_cache import cached_dataset
+from model_manager import MODEL_SCHEMAS
+from training_profiler import current_rss_mb, format_mb, peak_rss_mb
+from uncertainty import REVIEW_THRESHOLD, normalized_entropy, score_with_uncertainty
+
+BRAIN_FIELDS = MODEL_SCHEMAS["Brain"]
+SEX_CODES = {"Female": 0, "Male": 1}
+
+# One fixed-size row per patient: 32 bytes instead of a dict plus a DataFrame row.
+# Continuous inputs stay float64 so they scale exactly as in the pipeline.
+RECORD_DTYPE = np.dtype([
+    ('Age', np.uint8), ('Sex', np.int8),
+    ('BP_Systolic', np.uint16), ('BP_Diastolic', np.uint16), ('RestingHR', np.uint16),
+    ('SpO2', np.float64), ('FastingBloodSugar', np.uint16), ('BMI', np.float64), ('StressLevel', np.uint8),
+    ('Smokes', np.int8), ('BlurredVision', np.int8), ('FrequentHeadaches', np.int8),
+    ('MobilityDizziness', np.int8), ('FamilyHistoryBrainEvent', np.int8),
+])
+
+# Largest probability / vote-entropy difference parity_check accepts; the only
+# remaining source is the float32 leaf probabilities (~3e-8 in practice)
+PARITY_TOLERANCE = 1e-6
+
+ASSESSMENT_DTYPE = np.dtype([('label', np.int8), ('confidence', np.float32), ('uncertainty', np.float32)])
+
+
+class BrainRecord:
+    # Single-patient record for callers that build inputs one at a time
+    __slots__ = tuple(BRAIN_FIELDS)
+
+    def __init__(self, **values):
+        for field in BRAIN_FIELDS:
+            setattr(self, field, values[field])
+
+    def as_tuple(self):
+        return tuple(checked_values(f, [getattr(self, f)])[0] for f in BRAIN_FIELDS)
+
+
+class Assessment:
+    __slots__ = ("label", "confidence", "uncertainty")
+
+    def __init__(self, label, confidence, uncertainty):
+        self.label = label
+        self.confidence = confidence
+        self.uncertainty = uncertainty
+
+
+# ========== Records ==========
+def checked_values(field, values):
+    # Values ready to store in RECORD_DTYPE[field]. numpy casts wrap silently
+    # (Age 300 -> 44), so out-of-range, missing and unknown values raise here.
+    values = np.asarray(values)
+    if field == 'Sex':
+        codes = np.full(len(values), -1, dtype=np.int8)
+        for name, code in SEX_CODES.items():
+            codes[values == name] = code
+        if (codes < 0).any():
+            unknown = values[codes < 0].tolist()[0]
+            raise ValueError(f"Unknown Sex value {unknown!r}; expected one of {list(SEX_CODES)}")
+        return codes
+
+    dtype = RECORD_DTYPE[field]
+    values = values.astype(np.float64)
+    if dtype.kind in "iu":
+        if np.isnan(values).any():
+            raise ValueError(f"{field} has missing values")
+        limits = np.iinfo(dtype)
+    else:
+        limits = np.finfo(dtype)
+    outside = (values < limits.min) | (values > limits.max)
+    if outside.any():
+        raise ValueError(f"{field} value {values[outside][0]:g} is outside {limits.min:g}..{limits.max:g}")
+    return values
+
+
+def records_from_frame(df):
+    records = np.empty(len(df), dtype=RECORD_DTYPE)
+    for field in BRAIN_FIELDS:
+        records[field] = checked_values(field, df[field].to_numpy())
+    return records
+
+
+def records_from_objects(objects):
+    return np.array([o.as_tuple() for o in objects], dtype=RECORD_DTYPE)
+
+
+# ========== Encoding ==========
+class CompactEncoder:
+    # Reproduces the pipeline's StandardScaler + OneHotEncoder directly on the
+    # struct array, writing one float32 matrix.
+
+    def __init__(self, preprocessor):
+        self.steps = []
+        width = 0
+        for name, transformer, columns in preprocessor.transformers_:
+            if name == 'remainder' or transformer == 'drop':
+                continue
+            block = preprocessor.output_indices_[name]
+            if isinstance(transformer, StandardScaler):
+                for i, column in enumerate(columns):
+                    self.steps.append(("scale", column, block.start + i, transformer.mean_[i], transformer.scale_[i]))
+            elif isinstance(transformer, OneHotEncoder):
+                offset = block.start
+                for j, column in enumerate(columns):
+                    categories = list(transformer.categories_[j])
+                    dropped = transformer.drop_idx_[j] if transformer.drop_idx_ is not None else None
+                    kept = [c for k, c in enumerate(categories) if k != dropped]
+                    codes = [SEX_CODES[c] if column == 'Sex' else c for c in kept]
+                    self.steps.append(("onehot", column, offset, codes, None))
+                    offset += len(kept)
+            else:
+                raise ValueError(f"Compact encoding does not support '{type(transformer).__name__}'")
+            width = max(width, block.stop)
+        self.width = width
+
+    def transform(self, records):
+        X = np.zeros((len(records), self.width), dtype=np.float32)
+        for kind, column, offset, a, b in self.steps:
+            values = records[column]
+            if kind == "scale":
+                # Scale in float64 like StandardScaler, then store as float32 like the trees do
+                X[:, offset] = (values.astype(np.float64) - a) / b
+            else:
+                for k, code in enumerate(a):
+                    X[:, offset + k] = values == code
+        return X
+
+
+# ========== Forest ==========
+class CompactForest:
+    # All trees of a RandomForestClassifier in flat arrays, walked level by level
+    # for a whole batch of (row, tree) pairs at once.
+
+    def __init__(self, forest):
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        depth = 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            n = tree.node_count
+            leaf = tree.children_left == -1
+            own = np.arange(offset, offset + n)
+            features.append(np.where(leaf, 0, tree.feature).astype(np.int16))
+            # sklearn compares float32 inputs against float64 thresholds; rounding
+            # the threshold down to the nearest float32 keeps every decision identical.
+            threshold = tree.threshold.astype(np.float32)
+            too_high = threshold.astype(np.float64) > tree.threshold
+            threshold[too_high] = np.nextafter(threshold[too_high], np.float32(-np.inf))
+            thresholds.append(threshold)
+            # Leaves point to themselves
+            lefts.append(np.where(leaf, own, tree.children_left + offset).astype(np.int32))
+            rights.append(np.where(leaf, own, tree.children_right + offset).astype(np.int32))
+            value = tree.value[:, 0, :]
+            values.append((value / value.sum(axis=1, keepdims=True)).astype(np.float32))
+            roots.append(offset)
+            offset += n
+            depth = max(depth, tree.max_depth)
+
+        self.feature = np.concatenate(features)
+        self.threshold = np.concatenate(thresholds)
+        # children[2 * node] is the left child, children[2 * node + 1] the right one
+        self.children = np.stack([np.concatenate(lefts), np.concatenate(rights)], axis=1).ravel()
+        self.is_leaf = self.children[0::2] == np.arange(len(self.feature))
+        self.value = np.concatenate(values)
+        # Class each node votes for, so hard votes need no argmax per (row, tree)
+        self.winner = self.value.argmax(axis=1).astype(np.int8)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.max_depth = depth
+        self.classes_ = forest.classes_
+
+    def nbytes(self):
+        return sum(a.nbytes for a in (self.feature, self.threshold, self.children, self.value, self.winner, self.roots))
+
+    def leaves(self, X):
+        # (rows, trees) leaf index for every tree
+        X = np.ascontiguousarray(X)
+        flat = X.ravel()
+        n_trees = len(self.roots)
+        node = np.tile(self.roots, len(X))
+        row_start = np.repeat(np.arange(len(X), dtype=np.int64) * X.shape[1], n_trees)
+        # Only (row, tree) pairs still above a leaf are advanced on each level
+        active = np.flatnonzero(~self.is_leaf[node])
+        while active.size:
+            current = node[active]
+            go_right = flat[row_start[active] + self.feature[current]] > self.threshold[current]
+            current = self.children[2 * current + go_right]
+            node[active] = current
+            active = active[~self.is_leaf[current]]
+        return node.reshape(len(X), n_trees)
+
+    def predict_proba(self, X, batch_size=4096):
+        proba = np.empty((len(X), len(self.classes_)), dtype=np.float32)
+        for start in range(0, len(X), batch_size):
+            leaves = self.leaves(X[start:start + batch_size])
+            proba[start:start + batch_size] = self.value[leaves].mean(axis=1)
+        return proba
+
+    def predict_with_uncertainty(self, X, batch_size=4096):
+        # Same traversal as predict_proba; the leaves reached also give the vote
+        # entropy and the spread of the winning class across trees.
+        n_classes = len(self.classes_)
+        proba = np.empty((len(X), n_classes), dtype=np.float32)
+        vote_entropy = np.empty(len(X), dtype=np.float32)
+        spread = np.empty(len(X), dtype=np.float32)
+        for start in range(0, len(X), batch_size):
+            leaves = self.leaves(X[start:start + batch_size])
+            values = self.value[leaves]
+            mean = values.mean(axis=1)
+            predicted = mean.argmax(axis=1)
+            votes = np.stack([(self.winner[leaves] == c).mean(axis=1) for c in range(n_classes)], axis=1)
+            batch = slice(start, start + len(leaves))
+            proba[batch] = mean
+            vote_entropy[batch] = normalized_entropy(votes)
+            spread[batch] = np.take_along_axis(values, predicted[:, None, None], axis=2)[:, :, 0].std(axis=1)
+        return proba, vote_entropy, spread
+
+
+class CompactBrainScorer:
+
+    def __init__(self, pipeline):
+        self.encoder = CompactEncoder(pipeline.named_steps['preprocessor'])
+        self.forest = CompactForest(pipeline.named_steps['classifier'])
+        self.classes_ = self.forest.classes_
+
+    def predict_proba(self, records):
+        return self.forest.predict_proba(self.encoder.transform(records))
+
+    def assess(self, records):
+        proba, vote_entropy, _ = self.forest.predict_with_uncertainty(self.encoder.transform(records))
+        results = np.empty(len(records), dtype=ASSESSMENT_DTYPE)
+        results['label'] = proba.argmax(axis=1)
+        results['confidence'] = proba.max(axis=1)
+        results['uncertainty'] = vote_entropy
+        return results
+
+    def assess_one(self, record):
+        result = self.assess(records_from_objects([record]))[0]
+        return Assessment(self.classes_[result['label']], float(result['confidence']), float(result['uncertainty']))
+
+
+# ========== Parity & Memory Report ==========
+def parity_check(pipeline, df, tolerance=PARITY_TOLERANCE):
+    # Raises AssertionError when the compact path drifts from the pipeline by
+    # more than `tolerance` in any probability or vote entropy, or changes a label
+    X = df[list(pipeline.feature_names_in_)]
+    expected = score_with_uncertainty(pipeline, X)
+    scorer = CompactBrainScorer(pipeline)
+    actual, vote_entropy, _ = scorer.forest.predict_with_uncertainty(scorer.encoder.transform(records_from_frame(X)))
+    result = {
+        "rows": len(X),
+        "max_abs_diff": float(np.abs(expected.proba - actual).max()),
+        "label_agreement": float((expected.proba.argmax(axis=1) == actual.argmax(axis=1)).mean()),
+        "max_uncertainty_diff": float(np.abs(expected.uncertainty - vote_entropy).max()),
+        "review_rate": float((vote_entropy >= REVIEW_THRESHOLD).mean()),
+    }
+    if (result["max_abs_diff"] > tolerance or result["max_uncertainty_diff"] > tolerance
+            or result["label_agreement"] < 1.0):
+        raise AssertionError(f"Compact scoring differs from the pipeline beyond {tolerance:g}: {result}")
+    return result
+
+
+def _measure(path, model_path, rows):
+    # Runs in a child process so each path gets its own RSS high-water mark
+    from train_brain_model_v2 import generate_dataset
+    import pandas as pd
+
+    pipeline = joblib.load(model_path)
+    df, _ = cached_dataset(generate_dataset, num_samples=rows, seed=11, columns=BRAIN_FIELDS)
+    before = current_rss_mb()
+    start = time.perf_counter()
+    if path == "baseline":
+        # Today's path: a dict per patient, a DataFrame, loose result dicts
+        patients = df.to_dict(orient="records")
+        del df
+        proba = pipeline.predict_proba(pd.DataFrame(patients))
+        results = [{"prediction": pipeline.classes_[p.argmax()], "confidence": float(p.max())} for p in proba]
+    else:
+        records = records_from_frame(df)
+        del df
+        results = CompactBrainScorer(pipeline).assess(records)
+    seconds = time.perf_counter() - start
+    after = current_rss_mb()
+    print(json.dumps({"path": path, "rows": rows, "seconds": seconds, "rss_before_mb": before,
+                      "rss_after_mb": after, "peak_rss_mb": peak_rss_mb(), "results": len(results)}))
+
+
+def memory_report(model_path, rows):
+    reports = []
+    for path in ("baseline", "compact"):
+        output = subprocess.run([sys.executable, __file__, "--measure", path, "--model", model_path,
+                                 "--rows", str(rows)], capture_output=True, text=True, check=True).stdout
+        reports.append(json.loads(output.strip().splitlines()[-1]))
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact brain scoring: parity check and memory report.")
+    parser.add_argument("--model", default="brain_model.pkl")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--parity", action="store_true")
+    parser.add_argument("--report", action="store_true")
+    parser.add_argument("--measure", choices=["baseline", "compact"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        _measure(args.measure, args.model, args.rows)
+        return
+
+    pipeline = joblib.load(args.model)
+    if args.parity or not args.report:
+        from train_brain_model_v2 import generate_dataset
+        df, _ = cached_dataset(generate_dataset, num_samples=min(args.rows, 100_000), seed=5)
+        result = parity_check(pipeline, df)
+        forest = pipeline.named_steps['classifier']
+        compact = CompactForest(forest)
+        node_bytes = sum(e.tree_.node_count for e in forest.estimators_) * (8 + 8 + 8 + 8 + 8 * len(forest.classes_))
+        print(f"\n🔬 Parity on {result['rows']:,} rows: max |Δp| = {result['max_abs_diff']:.2e}, "
+              f"label agreement = {result['label_agreement'] * 100:.3f}%")
+        print(f"🌳 Vote entropy: max |Δ| = {result['max_uncertainty_diff']:.2e}, "
+              f"{result['review_rate'] * 100:.1f}% of patients at or above the review threshold")
+        print(f"🌲 Tree storage: {node_bytes / 1e6:.1f} MB float64 -> {compact.nbytes() / 1e6:.1f} MB compact")
+
+    if args.report:
+        print(f"\n📦 Memory report for {args.rows:,} patients:")
+        for r in memory_report(args.model, args.rows):
+            grown = None if None in (r['rss_after_mb'], r['rss_before_mb']) else r['rss_after_mb'] - r['rss_before_mb']
+            print(f"{r['path']:<9} {format_mb(grown, '+8.1f')} MB RSS after scoring, "
+                  f"peak {format_mb(r['peak_rss_mb'])} MB, {r['seconds']:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# "What would lower my risk?" search for the brain and heart models.
+#
+# For one patient, every combination of plausible changes to the modifiable
+# features is laid out as a grid of rows and scored with a single batched
+# predict_proba call. The smallest combinations that land in a lower risk class
+# are returned as suggestions.
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Lower rank = lower risk, for both the brain and the heart labels
+RISK_RANK = {
+    'NoRisk': 0, 'Warning': 1, 'EmergencyRisk': 2,
+    'NoDisease': 0, 'LateDiagnosis': 1, 'SuddenDeath': 2,
+}
+
+# step: grid spacing, max_change: furthest the search goes, floor: never suggest
+# going below this, effort: size of change that counts as one unit of effort
+Action = namedtuple("Action", ["label", "unit", "step", "max_change", "floor", "effort"])
+
+ACTIONS = {
+    'BP_Systolic': Action("systolic BP", "mmHg", 5, 40, 110, 20),
+    'RestingBP': Action("resting BP", "mmHg", 5, 30, 100, 20),
+    'BMI': Action("BMI", "", 1.0, 8.0, 18.5, 3.0),
+    'StressLevel': Action("stress level", "/10", 1, 6, 1, 3),
+    'FastingBloodSugar': Action("fasting blood sugar", "mg/dL", 10, 60, 80, 30),
+    'Cholesterol': Action("cholesterol", "mg/dL", 10, 80, 140, 40),
+    # Yes/no habits: the only change is to stop
+    'Smokes': Action("smoking", "", 1, 1, 0, 1),
+    'FastingBS': Action("fasting blood sugar > 120", "", 1, 1, 0, 1),
+}
+
+Counterfactual = namedtuple("Counterfactual", ["changes", "prediction", "probability", "effort"])
+
+
+def candidate_values(feature, value):
+    # Current value first, then steps toward the healthy side down to the floor
+    action = ACTIONS[feature]
+    if value <= action.floor:
+        return np.array([value])
+    n_steps = int(action.max_change // action.step)
+    values = value - action.step * np.arange(n_steps + 1)
+    values = np.unique(np.maximum(values, action.floor))[::-1]
+    return values.astype(type(value)) if isinstance(value, (int, np.integer)) else values
+
+
+def build_grid(model, patient):
+    # One row per combination of candidate values; unchanged features repeat
+    features = [f for f in model.feature_names_in_ if f in ACTIONS]
+    options = [candidate_values(f, patient[f]) for f in features]
+    mesh = np.meshgrid(*options, indexing="ij")
+    size = mesh[0].size if mesh else 1
+    grid = pd.DataFrame({f: np.repeat(np.asarray([patient[f]]), size) for f in model.feature_names_in_})
+    for feature, values in zip(features, mesh):
+        grid[feature] = values.ravel()
+    return grid, features
+
+
+def find_counterfactuals(model, patient, max_results=3):
+    grid, features = build_grid(model, patient)
+    proba = model.predict_proba(grid)
+    ranks = np.array([RISK_RANK[c] for c in model.classes_])
+    predicted = proba.argmax(axis=1)
+    # Row 0 is the unchanged patient
+    current_rank = ranks[predicted[0]]
+    improved = np.flatnonzero(ranks[predicted] < current_rank)
+    if not improved.size:
+        return []
+
+    original = np.array([float(patient[f]) for f in features])
+    scale = np.array([ACTIONS[f].effort for f in features], dtype=float)
+    deltas = original - grid[features].to_numpy(dtype=float)[improved]
+    changed = (deltas > 0).sum(axis=1)
+    effort = (deltas / scale).sum(axis=1)
+    # Fewest features changed first, then the least total effort
+    order = np.lexsort((effort, changed))
+
+    results, kept = [], []
+    for i in order:
+        # Skip candidates that only add change on top of one already suggested
+        if any(np.all(deltas[i] >= k) for k in kept):
+            continue
+        row = improved[i]
+        changes = {f: (patient[f], grid.at[row, f]) for f, d in zip(features, deltas[i]) if d > 0}
+        label = model.classes_[predicted[row]]
+        results.append(Counterfactual(changes, label, float(proba[row, predicted[row]]), float(effort[i])))
+        kept.append(deltas[i])
+        if len(results) == max_results:
+            break
+    return results
+
+
+def describe_change(feature, old, new):
+    action = ACTIONS[feature]
+    if action.max_change == 1 and action.floor == 0:
+        return f"stop {action.label}" if feature == 'Smokes' else f"bring {action.label} under control"
+    unit = f" {action.unit}" if action.unit and not action.unit.startswith("/") else action.unit
+    return f"lower {action.label} from {old:g} to {new:g}{unit}"
+
+
+def describe(counterfactual):
+    return ", ".join(describe_change(f, old, new) for f, (old, new) in counterfactual.changes.items())
+
+
+def print_counterfactuals(model, patient, prediction, max_results=3):
+    if RISK_RANK[prediction] == 0:
+        return []
+    suggestions = find_counterfactuals(model, patient, max_results)
+    print("\n🔁 What could lower your risk:")
+    if not suggestions:
+        print("• No small change to the modifiable factors lowers the predicted risk class.")
+    for s in suggestions:
+        text = describe(s)
+        print(f"• {text[0].upper() + text[1:]} → predicted {s.prediction} ({s.probability * 100:.0f}%)")
+    return suggestions
@@ -0,0 +1,136 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# On-disk cache of generated training datasets, keyed by the generator, its
+# parameters (seed, size, ...) and the generator's source code, so a changed
+# generator never serves a stale dataset.
+#
+# Each dataset is a directory with one .npy file per column, opened with
+# np.load(mmap_mode='r'): loading is near-instant at any size and pages are only
+# read when a column is used. String columns are stored as integer codes, with
+# their categories in meta.json, and come back as pandas Categoricals.
+#
+#   python dataset_cache.py train_brain_model_v2 --rows 5000000
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = os.path.join(".cache", "datasets")
+CACHE_VERSION = 2
+META_FILE = "meta.json"
+
+
+def generator_name(generate):
+    # Scripts run directly report __main__; use the file name instead
+    module = generate.__module__
+    if module == "__main__":
+        module = os.path.splitext(os.path.basename(inspect.getsourcefile(generate)))[0]
+    return f"{module}.{generate.__name__}"
+
+
+def normalize_params(generate, args, params):
+    # Positional and default arguments produce the same key as explicit ones
+    bound = inspect.signature(generate).bind(*args, **params)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+def dataset_key(generate, params):
+    payload = json.dumps({
+        "version": CACHE_VERSION,
+        "generator": generator_name(generate),
+        "source": inspect.getsource(generate),
+        "params": params,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# ========== Column Store ==========
+def write_columns(df, directory):
+    meta = {"rows": len(df), "columns": []}
+    for column in df.columns:
+        values = df[column]
+        entry = {"name": str(column), "file": f"{len(meta['columns']):03d}.npy"}
+        if values.dtype.kind in "biuf":
+            array = values.to_numpy()
+        else:
+            codes, categories = pd.factorize(values, sort=True)
+            if (codes < 0).any():
+                raise ValueError(f"Column '{column}' has missing values; the dataset cache does not store them")
+            array = codes.astype(np.min_scalar_type(max(len(categories) - 1, 0)))
+            entry["categories"] = [c.item() if isinstance(c, np.generic) else c for c in categories]
+        np.save(os.path.join(directory, entry["file"]), np.ascontiguousarray(array))
+        meta["columns"].append(entry)
+    with open(os.path.join(directory, META_FILE), "w") as f:
+        json.dump(meta, f)
+
+
+def read_columns(directory, columns=None):
+    with open(os.path.join(directory, META_FILE)) as f:
+        meta = json.load(f)
+    data = {}
+    for entry in meta["columns"]:
+        if columns is not None and entry["name"] not in columns:
+            continue
+        array = np.load(os.path.join(directory, entry["file"]), mmap_mode="r")
+        if "categories" in entry:
+            array = pd.Categorical.from_codes(array, entry["categories"])
+        data[entry["name"]] = array
+    # copy=False keeps numeric columns backed by the memory-mapped files
+    return pd.DataFrame(data, copy=False)
+
+
+# ========== Cache ==========
+def dataset_path(generate, params, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, f"{generator_name(generate)}-{dataset_key(generate, params)}")
+
+
+def cached_dataset(generate, *args, cache_dir=CACHE_DIR, columns=None, **params):
+    # Returns (df, key); df.attrs["dataset_cache"] is "hit" or "miss". Concurrent
+    # workers asking for the same dataset may both generate it; each writes a
+    # private directory and the first rename wins.
+    params = normalize_params(generate, args, params)
+    path = dataset_path(generate, params, cache_dir)
+    key = os.path.basename(path)
+    hit = os.path.exists(os.path.join(path, META_FILE))
+    if not hit:
+        df = generate(**params)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=cache_dir, prefix=".tmp-")
+        try:
+            write_columns(df, tmp_dir)
+            os.replace(tmp_dir, path)
+        except OSError:
+            if not os.path.exists(os.path.join(path, META_FILE)):
+                raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    df = read_columns(path, columns)
+    df.attrs["dataset_cache"] = "hit" if hit else "miss"
+    return df, key
+
+
+if __name__ == "__main__":
+    import argparse
+    import importlib
+    import time
+
+    parser = argparse.ArgumentParser(description="Generate (or load) a cached training dataset and time it.")
+    parser.add_argument("module", help="training script module, e.g. train_brain_model_v2")
+    parser.add_argument("--rows", type=int, help="dataset size (the generator's first argument)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    generate = importlib.import_module(args.module).generate_dataset
+    size = [args.rows] if args.rows else []
+    start = time.perf_counter()
+    df, key = cached_dataset(generate, *size, seed=args.seed)
+    print(f"📦 {len(df):,} rows x {df.shape[1]} columns from {os.path.join(CACHE_DIR, key)} "
+          f"in {time.perf_counter() - start:.3f}s")
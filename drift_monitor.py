@@ -0,0 +1,250 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Streaming input-drift monitor.
+#
+# Each feature keeps a fixed-size sketch (a fixed-edge histogram for numeric
+# features, category counts for categorical ones). Updating a sketch is O(1) per
+# request. Training saves reference sketches next to the model, and live
+# sketches are compared against them with the population stability index (PSI).
+# Missing values (None/NaN) are counted separately and left out of the PSI.
+#
+#   python drift_monitor.py brain_model_drift.json live_inputs.csv
+
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_BINS = 20
+# Common PSI reading: < 0.1 stable, 0.1-0.25 moderate shift, > 0.25 major shift
+PSI_WARNING = 0.1
+PSI_ALERT = 0.25
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def reference_path(model_path):
+    return os.path.splitext(model_path)[0] + "_drift.json"
+
+
+# ========== Sketches ==========
+class NumericSketch:
+    # Equal-width bins over the training range plus one underflow and one
+    # overflow bin, so out-of-range production values are still counted.
+
+    def __init__(self, low, high, bins=DEFAULT_BINS, counts=None, missing=0):
+        self.low = float(low)
+        self.high = float(high) if high > low else float(low) + 1.0
+        self.bins = bins
+        self.scale = bins / (self.high - self.low)
+        self.counts = list(counts) if counts is not None else [0] * (bins + 2)
+        self.missing = missing
+
+    def update(self, value):
+        if _is_missing(value):
+            self.missing += 1
+        elif value < self.low:
+            self.counts[0] += 1
+        elif value >= self.high:
+            self.counts[-1] += 1
+        else:
+            self.counts[1 + min(int((value - self.low) * self.scale), self.bins - 1)] += 1
+
+    def update_many(self, values):
+        values = np.asarray(values, dtype=float)
+        present = ~np.isnan(values)
+        self.missing += int(len(values) - present.sum())
+        values = values[present]
+        index = np.clip(np.floor((values - self.low) * self.scale).astype(int) + 1, 1, self.bins)
+        index[values < self.low] = 0
+        index[values >= self.high] = self.bins + 1
+        for i, n in enumerate(np.bincount(index, minlength=self.bins + 2)):
+            self.counts[i] += int(n)
+
+    def empty(self):
+        return NumericSketch(self.low, self.high, self.bins)
+
+    def to_dict(self):
+        return {"type": "numeric", "low": self.low, "high": self.high, "bins": self.bins, "counts": self.counts,
+                "missing": self.missing}
+
+
+class CategoricalSketch:
+    # Counts per training category plus one bucket for unseen values
+
+    def __init__(self, categories, counts=None, missing=0):
+        self.categories = [str(c) for c in categories]
+        self._index = {c: i for i, c in enumerate(self.categories)}
+        self.counts = list(counts) if counts is not None else [0] * (len(self.categories) + 1)
+        self.missing = missing
+
+    def update(self, value):
+        if _is_missing(value):
+            self.missing += 1
+        else:
+            self.counts[self._index.get(str(value), -1)] += 1
+
+    def update_many(self, values):
+        values = np.asarray(values, dtype=object)
+        present = ~pd.isna(values)
+        self.missing += int(len(values) - present.sum())
+        for value, n in zip(*np.unique(values[present].astype(str), return_counts=True)):
+            self.counts[self._index.get(value, -1)] += int(n)
+
+    def empty(self):
+        return CategoricalSketch(self.categories)
+
+    def to_dict(self):
+        return {"type": "categorical", "categories": self.categories, "counts": self.counts, "missing": self.missing}
+
+
+def sketch_from_dict(data):
+    if data["type"] == "numeric":
+        return NumericSketch(data["low"], data["high"], data["bins"], data["counts"], data.get("missing", 0))
+    return CategoricalSketch(data["categories"], data["counts"], data.get("missing", 0))
+
+
+def psi(reference_counts, live_counts, epsilon=1e-4):
+    expected = np.asarray(reference_counts, dtype=float)
+    actual = np.asarray(live_counts, dtype=float)
+    expected = np.clip(expected / max(expected.sum(), 1), epsilon, None)
+    actual = np.clip(actual / max(actual.sum(), 1), epsilon, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+# ========== Reference Sketches ==========
+def at_resolution(values, step):
+    # Values as an input widget with this step would collect them
+    return np.round(np.asarray(values, dtype=float) / step) * step
+
+
+def numeric_sketch(low, high, bins=DEFAULT_BINS, step=None):
+    # Sketch over [low, high]. With the step live inputs come in (e.g. a
+    # slider's 1), edges sit halfway between steps and each bin spans whole
+    # steps; bins narrower than the step would leave live values in every
+    # other bin and read as drift. Values must then be fed at_resolution().
+    if not step:
+        return NumericSketch(low, np.nextafter(high, np.inf), bins)
+    low, high = at_resolution(low, step), at_resolution(high, step)
+    n_steps = int(round((high - low) / step)) + 1
+    steps_per_bin = -(-n_steps // bins)
+    n_bins = -(-n_steps // steps_per_bin)
+    return NumericSketch(low - step / 2, low - step / 2 + n_bins * steps_per_bin * step, n_bins)
+
+
+def build_reference(df, numeric_features, categorical_features, bins=DEFAULT_BINS, resolution=None):
+    # resolution maps features to the step of their live inputs; see numeric_sketch()
+    resolution = resolution or {}
+    sketches = {}
+    for feature in numeric_features:
+        values = df[feature].to_numpy(dtype=float)
+        step = resolution.get(feature)
+        sketch = numeric_sketch(values.min(), values.max(), bins, step)
+        sketch.update_many(at_resolution(values, step) if step else values)
+        sketches[feature] = sketch
+    for feature in categorical_features:
+        sketch = CategoricalSketch(sorted(df[feature].astype(str).unique()))
+        sketch.update_many(df[feature])
+        sketches[feature] = sketch
+    return sketches
+
+
+def save_reference(df, numeric_features, categorical_features, model_path, bins=DEFAULT_BINS, resolution=None):
+    return write_reference(build_reference(df, numeric_features, categorical_features, bins, resolution), model_path)
+
+
+def write_reference(sketches, model_path):
+    path = reference_path(model_path)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({feature: sketch.to_dict() for feature, sketch in sketches.items()}, f)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_reference(path):
+    with open(path) as f:
+        return {feature: sketch_from_dict(data) for feature, data in json.load(f).items()}
+
+
+def check_reference(reference, df, resolution=None, threshold=PSI_ALERT):
+    # Feeds an in-distribution sample in at the input resolution and returns
+    # the features whose PSI still reaches `threshold`; empty when the
+    # reference is usable for live monitoring
+    sample = df.copy()
+    for feature, step in (resolution or {}).items():
+        if feature in sample:
+            sample[feature] = at_resolution(sample[feature], step)
+    monitor = DriftMonitor(reference, min_count=0)
+    monitor.observe_frame(sample)
+    return monitor.alerts(threshold)
+
+
+# ========== Monitor ==========
+class DriftMonitor:
+    # Holds live sketches shaped like the reference ones. observe() is called
+    # inline with scoring; scores() is only computed when someone asks.
+    # `features` limits monitoring to the inputs a caller actually collects;
+    # values it fills in with constants would always read as drift.
+
+    def __init__(self, reference, min_count=200, features=None):
+        if features is not None:
+            reference = {feature: reference[feature] for feature in features if feature in reference}
+        self.reference = reference
+        self.live = {feature: sketch.empty() for feature, sketch in reference.items()}
+        self.min_count = min_count
+        self.count = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_model_path(cls, model_path, **kwargs):
+        path = reference_path(model_path)
+        return cls(load_reference(path), **kwargs) if os.path.exists(path) else None
+
+    def observe(self, record):
+        with self._lock:
+            for feature, sketch in self.live.items():
+                value = record.get(feature)
+                if value is not None:
+                    sketch.update(value)
+            self.count += 1
+
+    def observe_frame(self, df):
+        with self._lock:
+            for feature, sketch in self.live.items():
+                if feature in df:
+                    sketch.update_many(df[feature].to_numpy())
+            self.count += len(df)
+
+    def scores(self):
+        with self._lock:
+            live_counts = {feature: list(sketch.counts) for feature, sketch in self.live.items()}
+        return {feature: psi(self.reference[feature].counts, counts) for feature, counts in live_counts.items()}
+
+    def alerts(self, threshold=PSI_ALERT):
+        if self.count < self.min_count:
+            return {}
+        return {feature: score for feature, score in self.scores().items() if score >= threshold}
+
+    def reset(self):
+        with self._lock:
+            self.live = {feature: sketch.empty() for feature, sketch in self.reference.items()}
+            self.count = 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python drift_monitor.py REFERENCE_JSON LIVE_INPUTS_CSV")
+
+    monitor = DriftMonitor(load_reference(sys.argv[1]), min_count=0)
+    monitor.observe_frame(pd.read_csv(sys.argv[2]))
+    print(f"\n📈 Input drift over {monitor.count:,} records (PSI):")
+    for feature, score in sorted(monitor.scores().items(), key=lambda item: -item[1]):
+        status = "🔴 major" if score >= PSI_ALERT else "🟠 moderate" if score >= PSI_WARNING else "🟢 stable"
+        print(f"{feature:<25} {score:8.4f}  {status}")
@@ -0,0 +1,120 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Incremental scorers for the app's live mode: as inputs change, only the work
+# that depends on the changed inputs is redone.
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from risk_rules import rule_points
+
+_MISSING = object()
+
+
+# ========== Rule-Based Modules ==========
+class IncrementalRuleScorer:
+    # Caches each rule's contribution; an update re-tests only the rules that
+    # read a changed input and applies the weight delta to the cached score.
+
+    def __init__(self, rules, cutoffs):
+        self.rules = rules
+        self.cutoffs = cutoffs
+        self.score = 0
+        self.values = {}
+        self.points = {}
+        self._rules_by_input = {}
+        for rule in rules:
+            for name in rule.inputs:
+                self._rules_by_input.setdefault(name, []).append(rule)
+
+    def update(self, values):
+        if not self.points:
+            stale = self.rules
+        else:
+            changed = [name for name, value in values.items() if self.values.get(name, _MISSING) != value]
+            stale = {rule.name: rule for name in changed for rule in self._rules_by_input.get(name, [])}.values()
+
+        for rule in stale:
+            new_points = rule_points(rule, values, self.cutoffs)
+            self.score += new_points - self.points.get(rule.name, 0)
+            self.points[rule.name] = new_points
+        self.values = dict(values)
+        return self.score
+
+
+# ========== Model-Backed Modules ==========
+class IncrementalModelScorer:
+    # Keeps the preprocessed feature row of the last input. When a feature
+    # changes only its slice of the row is re-encoded (scaled value or one-hot
+    # block) before the classifier is called.
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.preprocessor = pipeline.named_steps['preprocessor']
+        self.classifier = pipeline.named_steps['classifier']
+        self.classes_ = pipeline.classes_
+        self.values = {}
+        self.row = None
+        self._encoders = {}
+        self._blocks = {}
+
+        for name, transformer, columns in self.preprocessor.transformers_:
+            if name == 'remainder' or transformer == 'drop':
+                continue
+            block = self.preprocessor.output_indices_[name]
+            if isinstance(transformer, StandardScaler):
+                for i, column in enumerate(columns):
+                    self._encoders.setdefault(column, []).append(
+                        (self._scale, (block.start + i, transformer.mean_[i], transformer.scale_[i])))
+            elif isinstance(transformer, OneHotEncoder):
+                offset = block.start
+                for j, column in enumerate(columns):
+                    categories = list(transformer.categories_[j])
+                    dropped = transformer.drop_idx_[j] if transformer.drop_idx_ is not None else None
+                    kept = [c for k, c in enumerate(categories) if k != dropped]
+                    self._encoders.setdefault(column, []).append((self._one_hot, (offset, kept)))
+                    offset += len(kept)
+            else:
+                # Any other transformer re-encodes its whole block
+                for column in columns:
+                    self._encoders.setdefault(column, []).append((self._block, (name, transformer, list(columns))))
+
+    def _scale(self, values, column, args):
+        index, mean, scale = args
+        self.row[index] = (values[column] - mean) / scale
+
+    def _one_hot(self, values, column, args):
+        offset, kept = args
+        self.row[offset:offset + len(kept)] = 0.0
+        if values[column] in kept:
+            self.row[offset + kept.index(values[column])] = 1.0
+
+    def _block(self, values, column, args):
+        name, transformer, columns = args
+        block = transformer.transform(pd.DataFrame([{c: values[c] for c in columns}]))
+        if hasattr(block, "toarray"):
+            block = block.toarray()
+        self.row[self.preprocessor.output_indices_[name]] = block[0]
+
+    def _full_transform(self, values):
+        row = self.preprocessor.transform(pd.DataFrame([values])[list(self.pipeline.feature_names_in_)])
+        if hasattr(row, "toarray"):
+            row = row.toarray()
+        return np.asarray(row[0], dtype=float)
+
+    def predict_proba(self, values):
+        if self.row is None:
+            self.row = self._full_transform(values)
+        else:
+            for column, value in values.items():
+                if self.values.get(column, _MISSING) == value:
+                    continue
+                for encode, args in self._encoders.get(column, []):
+                    encode(values, column, args)
+        self.values = dict(values)
+        return self.classifier.predict_proba(self.row.reshape(1, -1))[0]
+
+    def predict(self, values):
+        return self.classes_[int(np.argmax(self.predict_proba(values)))]
@@ -0,0 +1,232 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Hot-reloading model manager: watches model artifacts and swaps in new versions
+# without restarting the app.
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import namedtuple
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# ========== Expected Model Schemas ==========
+MODEL_SCHEMAS = {
+    "Heart": ['Age', 'Sex', 'Cholesterol', 'MaxHR', 'ST_Slope', 'FastingBS', 'RestingBP', 'ExerciseAngina'],
+    "Brain": ['Age', 'Sex', 'BP_Systolic', 'BP_Diastolic', 'RestingHR', 'SpO2', 'FastingBloodSugar', 'BMI',
+              'StressLevel', 'Smokes', 'BlurredVision', 'FrequentHeadaches', 'MobilityDizziness',
+              'FamilyHistoryBrainEvent'],
+}
+
+MODEL_CLASSES = {
+    "Heart": {'NoDisease', 'LateDiagnosis', 'SuddenDeath'},
+    "Brain": {'NoRisk', 'Warning', 'EmergencyRisk'},
+}
+
+# Known inputs every candidate model must score before it is swapped in
+SMOKE_BATCHES = {
+    "Heart": [
+        {'Age': 45, 'Sex': 'Male', 'Cholesterol': 190, 'MaxHR': 150, 'ST_Slope': 'Up',
+         'FastingBS': 0, 'RestingBP': 120, 'ExerciseAngina': 'No'},
+        {'Age': 68, 'Sex': 'Female', 'Cholesterol': 260, 'MaxHR': 118, 'ST_Slope': 'Down',
+         'FastingBS': 1, 'RestingBP': 162, 'ExerciseAngina': 'Yes'},
+    ],
+    "Brain": [
+        {'Age': 40, 'Sex': 'Female', 'BP_Systolic': 118, 'BP_Diastolic': 76, 'RestingHR': 68, 'SpO2': 98.0,
+         'FastingBloodSugar': 90, 'BMI': 23.0, 'StressLevel': 3, 'Smokes': 0, 'BlurredVision': 0,
+         'FrequentHeadaches': 0, 'MobilityDizziness': 0, 'FamilyHistoryBrainEvent': 0},
+        {'Age': 72, 'Sex': 'Male', 'BP_Systolic': 185, 'BP_Diastolic': 110, 'RestingHR': 104, 'SpO2': 92.0,
+         'FastingBloodSugar': 170, 'BMI': 33.0, 'StressLevel': 9, 'Smokes': 1, 'BlurredVision': 1,
+         'FrequentHeadaches': 1, 'MobilityDizziness': 1, 'FamilyHistoryBrainEvent': 1},
+    ],
+}
+
+ModelVersion = namedtuple("ModelVersion", ["model", "path", "version", "loaded_at"])
+
+# Written by train_all.py; artifact paths inside it are relative to its directory
+MANIFEST_PATH = os.path.join("models", "manifest.json")
+
+
+# ========== Atomic Artifact Writes ==========
+def save_model_atomic(model, path):
+    # Write to a temp file in the same directory, then rename over the target so
+    # readers only ever see a complete artifact.
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".pkl")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            joblib.dump(model, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def file_signature(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# ========== Manifest ==========
+def read_manifest(path=MANIFEST_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def manifest_model_paths(path=MANIFEST_PATH):
+    # {system: artifact path} for the manifest entries the app serves
+    if not os.path.exists(path):
+        return {}
+    base = os.path.dirname(path)
+    return {entry["system"]: os.path.join(base, entry["artifact"])
+            for entry in read_manifest(path)["models"].values() if entry.get("system")}
+
+
+# ========== Validation ==========
+def validate_model(system, model):
+    for attr in ("predict", "predict_proba"):
+        if not hasattr(model, attr):
+            raise ValueError(f"{system} model has no '{attr}' method")
+
+    expected = MODEL_SCHEMAS.get(system)
+    if expected is not None:
+        features = list(getattr(model, "feature_names_in_", []))
+        if features and features != expected:
+            raise ValueError(f"{system} model expects columns {features}, not {expected}")
+
+    classes = MODEL_CLASSES.get(system)
+    if classes is not None and set(model.classes_) != classes:
+        raise ValueError(f"{system} model predicts {sorted(model.classes_)}, expected {sorted(classes)}")
+
+    batch = SMOKE_BATCHES.get(system)
+    if batch:
+        proba = np.asarray(model.predict_proba(pd.DataFrame(batch)))
+        if proba.shape != (len(batch), len(model.classes_)):
+            raise ValueError(f"{system} model returned probabilities of shape {proba.shape}")
+        if not np.all(np.isfinite(proba)) or not np.allclose(proba.sum(axis=1), 1.0):
+            raise ValueError(f"{system} model returned invalid probabilities")
+
+
+# ========== Model Manager ==========
+class ModelManager:
+    # Polls each artifact for changes and loads new versions on a background
+    # thread. Callers grab the current ModelVersion and keep using it, so
+    # in-flight requests finish on the old model while the new one is swapped in.
+
+    def __init__(self, model_paths, poll_interval=2.0, settle_time=1.0, manifest_path=None):
+        self.model_paths = dict(model_paths)
+        self.manifest_path = manifest_path
+        self.poll_interval = poll_interval
+        self.settle_time = settle_time
+        self.errors = {}
+        self._versions = {}
+        self._pending = {}
+        self._rejected = {}
+        self._manifest_version = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        # Load whatever is on disk up front so the first request is not a cold start
+        self._follow_manifest()
+        for system in self.model_paths:
+            path = self.model_paths[system]
+            if os.path.exists(path):
+                self._load(system, path, file_signature(path))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="model-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get(self, system):
+        return self._versions.get(system)
+
+    def model(self, system):
+        current = self.get(system)
+        return current.model if current else None
+
+    def check_now(self):
+        now = time.monotonic()
+        self._follow_manifest()
+        for system, path in self.model_paths.items():
+            try:
+                signature = file_signature(path)
+            except FileNotFoundError:
+                self._pending.pop(system, None)
+                continue
+
+            current = self._versions.get(system)
+            if current and current.path == path and current.version == signature:
+                continue
+            if self._rejected.get(system) == signature:
+                continue
+
+            # Only load once the file has stopped changing for settle_time, so a
+            # trainer still writing the artifact in place is never picked up.
+            seen = self._pending.get(system)
+            if seen is None or seen[0] != signature:
+                self._pending[system] = (signature, now)
+                continue
+            if now - seen[1] < self.settle_time:
+                continue
+
+            del self._pending[system]
+            self._load(system, path, signature)
+
+    def _follow_manifest(self):
+        # A new manifest points systems at new versioned artifacts; they are then
+        # picked up by the normal settle-and-validate path in check_now().
+        if self.manifest_path is None:
+            return
+        try:
+            signature = file_signature(self.manifest_path)
+        except FileNotFoundError:
+            return
+        if signature == self._manifest_version:
+            return
+        try:
+            paths = manifest_model_paths(self.manifest_path)
+        except (OSError, ValueError, KeyError) as e:
+            self.errors["manifest"] = f"{type(e).__name__}: {e}"
+            return
+        self._manifest_version = signature
+        self.errors.pop("manifest", None)
+        self.model_paths.update(paths)
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            self.check_now()
+
+    def _load(self, system, path, signature):
+        try:
+            model = joblib.load(path)
+            validate_model(system, model)
+        except Exception as e:
+            self._rejected[system] = signature
+            self.errors[system] = f"{type(e).__name__}: {e}"
+            return False
+
+        new_version = ModelVersion(model, path, signature, time.time())
+        with self._lock:
+            # Copy-on-write so readers never see a partially updated mapping
+            versions = dict(self._versions)
+            versions[system] = new_version
+            self._versions = versions
+        self.errors.pop(system, None)
+        self._rejected.pop(system, None)
+        return True
@@ -0,0 +1,96 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Rule tables for the simulated (rule-based) body systems in app.py.
+#
+# Each rule adds `points` to the risk score when `test(values, cutoffs)` is true.
+# Tests only use element-wise operators, so the same rule scores a single input
+# dict or whole pandas columns of a cohort.
+
+from collections import namedtuple
+
+import numpy as np
+
+Rule = namedtuple("Rule", ["name", "inputs", "points", "cutoffs", "test"])
+
+
+def flag(name, points=1):
+    return Rule(name, (name,), points, (), lambda v, c: np.asarray(v[name], dtype=bool))
+
+
+def is_in(value, options):
+    return np.isin(value, options)
+
+
+# ========== Cutoffs ==========
+# band_low/band_high: score <= band_low is Low, <= band_high is Moderate, else High
+CUTOFFS = {
+    "Heart": {"bp": 140, "cholesterol": 240, "hr_low": 60, "hr_high": 100, "oldpeak": 2,
+              "band_low": 3, "band_high": 6},
+    "Lungs": {"spo2": 93, "resp_rate": 20, "hr": 100, "band_low": 3, "band_high": 6},
+    "Liver": {"alt": 50, "ast": 50, "bilirubin": 1.2, "albumin": 3.5, "band_low": 3, "band_high": 6},
+    "Kidney": {"creatinine": 1.3, "bun": 30, "gfr": 60, "band_low": 3, "band_high": 6},
+    "Diabetes": {"fbs": 126, "ppbs": 200, "hba1c": 6.5, "band_low": 3, "band_high": 6},
+}
+
+# ========== Rules ==========
+RULES = {
+    "Heart": [
+        Rule("Chest Pain", ("Chest Pain",), 2, (),
+             lambda v, c: is_in(v["Chest Pain"], ["Typical Angina", "Atypical Angina"])),
+        Rule("BP", ("BP",), 1, ("bp",), lambda v, c: v["BP"] > c["bp"]),
+        Rule("Cholesterol", ("Cholesterol",), 1, ("cholesterol",), lambda v, c: v["Cholesterol"] > c["cholesterol"]),
+        flag("FBS > 120"),
+        Rule("RestECG", ("RestECG",), 1, (), lambda v, c: np.asarray(v["RestECG"]) != "Normal"),
+        Rule("Heart Rate", ("Heart Rate",), 1, ("hr_low", "hr_high"),
+             lambda v, c: (v["Heart Rate"] < c["hr_low"]) | (v["Heart Rate"] > c["hr_high"])),
+        flag("Exercise Angina", 2),
+        Rule("Oldpeak", ("Oldpeak",), 1, ("oldpeak",), lambda v, c: v["Oldpeak"] >= c["oldpeak"]),
+        Rule("ST Slope", ("ST Slope",), 1, (), lambda v, c: is_in(v["ST Slope"], ["Flat", "Downsloping"])),
+    ],
+    "Lungs": [
+        flag("Cough"), flag("Breathless"), flag("Wheezing"), flag("Chest Tightness"),
+        flag("Fatigue"), flag("Smoker"), flag("Pollutant Exposure"),
+        Rule("SpO2", ("SpO2",), 2, ("spo2",), lambda v, c: v["SpO2"] < c["spo2"]),
+        Rule("Respiratory Rate", ("Respiratory Rate",), 1, ("resp_rate",),
+             lambda v, c: v["Respiratory Rate"] > c["resp_rate"]),
+        Rule("Heart Rate", ("Heart Rate",), 1, ("hr",), lambda v, c: v["Heart Rate"] > c["hr"]),
+    ],
+    "Liver": [
+        flag("Fatigue"), flag("Jaundice"), flag("Nausea"), flag("Swelling"), flag("Alcohol"),
+        Rule("Enzymes", ("ALT", "AST"), 2, ("alt", "ast"), lambda v, c: (v["ALT"] > c["alt"]) | (v["AST"] > c["ast"])),
+        Rule("Bilirubin", ("Bilirubin",), 2, ("bilirubin",), lambda v, c: v["Bilirubin"] > c["bilirubin"]),
+        Rule("Albumin", ("Albumin",), 1, ("albumin",), lambda v, c: v["Albumin"] < c["albumin"]),
+    ],
+    "Kidney": [
+        flag("Urination Issues"), flag("Swelling"), flag("Hematuria"), flag("Fatigue"), flag("Albuminuria"),
+        Rule("Creatinine", ("Creatinine",), 2, ("creatinine",), lambda v, c: v["Creatinine"] > c["creatinine"]),
+        Rule("BUN", ("BUN",), 1, ("bun",), lambda v, c: v["BUN"] > c["bun"]),
+        Rule("GFR", ("GFR",), 2, ("gfr",), lambda v, c: v["GFR"] < c["gfr"]),
+    ],
+    "Diabetes": [
+        flag("Thirst"), flag("Frequent Urination"), flag("Weight Loss"), flag("Fatigue"), flag("Family History"),
+        Rule("FBS", ("FBS",), 2, ("fbs",), lambda v, c: v["FBS"] > c["fbs"]),
+        Rule("PPBS", ("PPBS",), 1, ("ppbs",), lambda v, c: v["PPBS"] > c["ppbs"]),
+        Rule("HbA1c", ("HbA1c",), 2, ("hba1c",), lambda v, c: v["HbA1c"] >= c["hba1c"]),
+    ],
+}
+
+RISK_LEVELS = ["Low", "Moderate", "High"]
+
+
+def rule_points(rule, values, cutoffs):
+    return rule.points if bool(rule.test(values, cutoffs)) else 0
+
+
+def score(system, values, cutoffs=None):
+    cutoffs = cutoffs or CUTOFFS[system]
+    return sum(rule_points(rule, values, cutoffs) for rule in RULES[system])
+
+
+def risk_band(total, cutoffs):
+    if total <= cutoffs["band_low"]:
+        return "Low"
+    elif total <= cutoffs["band_high"]:
+        return "Moderate"
+    return "High"
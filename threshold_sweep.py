@@ -0,0 +1,176 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# What-if sweep over the rule cutoffs in risk_rules.py: how would the
+# Low/Moderate/High mix of a cohort change if the thresholds moved?
+#
+# Every rule is evaluated once per distinct value of the cutoffs it reads,
+# giving one boolean column per value. Patients with identical rows across all
+# those columns score identically under every configuration, so they are
+# collapsed into weighted patterns, and the whole grid is scored by broadcasting
+# over patterns x configurations.
+#
+#   python threshold_sweep.py Kidney cohort.csv --grid gfr=45:75:5 band_low=2,3,4
+#   python threshold_sweep.py Diabetes --synthetic 1000000 --grid fbs=110:140:2 hba1c=6.0:7.0:0.1
+
+import argparse
+import itertools
+import time
+
+import numpy as np
+import pandas as pd
+
+from risk_rules import CUTOFFS, RISK_LEVELS, RULES
+
+# Input ranges of the app's widgets, used for synthetic cohorts
+INPUT_RANGES = {
+    "Heart": {"Chest Pain": ["Typical Angina", "Atypical Angina", "Non-Anginal", "Asymptomatic"],
+              "BP": (80, 200), "Cholesterol": (100, 400), "FBS > 120": None,
+              "RestECG": ["Normal", "ST-T Abnormality", "LV Hypertrophy"], "Heart Rate": (40, 200),
+              "Exercise Angina": None, "Oldpeak": (0.0, 6.0), "ST Slope": ["Upsloping", "Flat", "Downsloping"]},
+    "Lungs": {"Cough": None, "Breathless": None, "Wheezing": None, "Chest Tightness": None, "Fatigue": None,
+              "Smoker": None, "Pollutant Exposure": None, "SpO2": (80, 100), "Respiratory Rate": (10, 40),
+              "Heart Rate": (40, 140)},
+    "Liver": {"Fatigue": None, "Jaundice": None, "Nausea": None, "Swelling": None, "Alcohol": None,
+              "ALT": (0, 200), "AST": (0, 200), "Bilirubin": (0.0, 5.0), "Albumin": (2.0, 5.5)},
+    "Kidney": {"Urination Issues": None, "Swelling": None, "Hematuria": None, "Fatigue": None,
+               "Albuminuria": None, "Creatinine": (0.5, 5.0), "BUN": (5, 80), "GFR": (10, 120)},
+    "Diabetes": {"Thirst": None, "Frequent Urination": None, "Weight Loss": None, "Fatigue": None,
+                 "Family History": None, "FBS": (70, 300), "PPBS": (100, 400), "HbA1c": (4.5, 15.0)},
+}
+
+
+def synthetic_cohort(system, num_patients, seed=42):
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, spec in INPUT_RANGES[system].items():
+        if spec is None:
+            columns[name] = rng.random(num_patients) < 0.3
+        elif isinstance(spec, list):
+            columns[name] = rng.choice(spec, size=num_patients)
+        elif isinstance(spec[0], float):
+            columns[name] = rng.uniform(spec[0], spec[1], size=num_patients).round(1)
+        else:
+            columns[name] = rng.integers(spec[0], spec[1] + 1, size=num_patients)
+    return pd.DataFrame(columns)
+
+
+def grid_configurations(grid):
+    # Cartesian product of {cutoff: [values]} as one row per configuration
+    names = list(grid)
+    return pd.DataFrame(list(itertools.product(*(grid[n] for n in names))), columns=names)
+
+
+# ========== Sweep ==========
+def sweep(system, cohort, configurations, base_cutoffs=None, chunk_size=2048):
+    if isinstance(configurations, dict):
+        configurations = grid_configurations(configurations)
+    base = dict(base_cutoffs or CUTOFFS[system])
+    unknown = set(configurations.columns) - set(base)
+    if unknown:
+        raise ValueError(f"Unknown {system} cutoffs: {', '.join(sorted(unknown))}")
+    swept = set(configurations.columns)
+    n_configs = len(configurations)
+
+    # Per-rule boolean matrices: one column per distinct value of the cutoffs it reads
+    fixed = np.zeros(len(cohort), dtype=np.int64)
+    matrices, points, column_index = [], [], []
+    for rule in RULES[system]:
+        keys = [k for k in rule.cutoffs if k in swept]
+        if not keys:
+            fixed += rule.points * np.asarray(rule.test(cohort, base), dtype=bool)
+            continue
+        combos = configurations[keys].drop_duplicates().reset_index(drop=True)
+        matrix = np.empty((len(cohort), len(combos)), dtype=bool)
+        for j, combo in enumerate(combos.to_dict(orient="records")):
+            matrix[:, j] = np.asarray(rule.test(cohort, {**base, **combo}), dtype=bool)
+        lookup = configurations[keys].merge(combos.reset_index(), on=keys, how="left")["index"].to_numpy()
+        matrices.append(matrix)
+        points.append(rule.points)
+        column_index.append(lookup)
+
+    # Collapse patients into distinct patterns of (fixed score, rule outcomes)
+    if matrices:
+        bits = np.packbits(np.hstack(matrices), axis=1)
+        keyed = np.ascontiguousarray(np.hstack([fixed[:, None].view(np.uint8), bits]))
+        _, first, weights = np.unique(keyed.view(np.dtype((np.void, keyed.shape[1]))).ravel(),
+                                      return_index=True, return_counts=True)
+    else:
+        _, first, weights = np.unique(fixed, return_index=True, return_counts=True)
+    pattern_fixed = fixed[first]
+    pattern_matrices = [m[first] for m in matrices]
+    weights = weights.astype(np.float64)
+
+    band_low = (configurations["band_low"].to_numpy() if "band_low" in swept
+                else np.full(n_configs, base["band_low"]))
+    band_high = (configurations["band_high"].to_numpy() if "band_high" in swept
+                 else np.full(n_configs, base["band_high"]))
+
+    counts = np.empty((n_configs, len(RISK_LEVELS)))
+    for start in range(0, n_configs, chunk_size):
+        stop = min(start + chunk_size, n_configs)
+        # patterns x configurations score matrix for this slice of the grid
+        scores = np.broadcast_to(pattern_fixed[:, None], (len(first), stop - start)).copy()
+        for matrix, rule_points, lookup in zip(pattern_matrices, points, column_index):
+            scores += rule_points * matrix[:, lookup[start:stop]]
+        low = scores <= band_low[None, start:stop]
+        moderate = ~low & (scores <= band_high[None, start:stop])
+        counts[start:stop, 0] = weights @ low
+        counts[start:stop, 1] = weights @ moderate
+        counts[start:stop, 2] = weights.sum() - counts[start:stop, 0] - counts[start:stop, 1]
+
+    result = configurations.reset_index(drop=True).copy()
+    for i, level in enumerate(RISK_LEVELS):
+        result[f"{level} %"] = 100 * counts[:, i] / len(cohort)
+    result.attrs["patterns"] = len(first)
+    return result
+
+
+# ========== CLI ==========
+def parse_grid_value(text):
+    # "start:stop:step" (stop inclusive) or "a,b,c"
+    if ":" in text:
+        start, stop, step = (float(v) for v in text.split(":"))
+        values = np.round(np.arange(start, stop + step / 2, step), 6)
+        return [int(v) if float(v).is_integer() else float(v) for v in values]
+    return [int(v) if v.lstrip("-").isdigit() else float(v) for v in text.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep rule cutoffs and report the risk-band mix per configuration.")
+    parser.add_argument("system", choices=sorted(RULES))
+    parser.add_argument("cohort", nargs="?", help="CSV whose columns match the app's inputs for the system")
+    parser.add_argument("--synthetic", type=int, default=100_000, help="synthetic cohort size when no CSV is given")
+    parser.add_argument("--grid", nargs="+", required=True, metavar="CUTOFF=VALUES",
+                        help="e.g. gfr=45:75:5 or band_low=2,3,4")
+    parser.add_argument("--output", help="write the full result table to this CSV")
+    args = parser.parse_args()
+
+    grid = {}
+    for item in args.grid:
+        name, _, values = item.partition("=")
+        grid[name] = parse_grid_value(values)
+
+    cohort = pd.read_csv(args.cohort) if args.cohort else synthetic_cohort(args.system, args.synthetic)
+    start = time.perf_counter()
+    result = sweep(args.system, cohort, grid)
+    seconds = time.perf_counter() - start
+
+    print(f"\n🎚️ {len(result):,} {args.system} cutoff configurations over {len(cohort):,} patients "
+          f"({result.attrs['patterns']:,} distinct patterns) in {seconds:.2f}s")
+    current = [CUTOFFS[args.system][name] for name in grid]
+    is_current = (result[list(grid)] == current).all(axis=1)
+    if is_current.any():
+        print("\nCurrent cutoffs:")
+        print(result[is_current].to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+    print("\nConfigurations with the most High-risk patients:")
+    print(result.nlargest(5, "High %").to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+    print("\nConfigurations with the fewest High-risk patients:")
+    print(result.nsmallest(5, "High %").to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+    if args.output:
+        result.to_csv(args.output, index=False)
+        print(f"\n📄 Full sweep saved as {args.output}")
+
+
+if __name__ == "__main__":
+    main()
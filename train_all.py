@@ -0,0 +1,181 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Trains every declared body-system model in parallel worker processes and
+# publishes versioned artifacts plus models/manifest.json, which app.py reads
+# in place of its hard-coded MODEL_PATHS.
+#
+#   python train_all.py
+#   python train_all.py --only brain heart --backend hist_gradient_boosting
+
+import argparse
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from classifier_backends import CLASSIFIER_BACKENDS, DEFAULT_BACKEND
+from dataset_cache import cached_dataset
+from drift_monitor import reference_path, save_reference
+from model_manager import MANIFEST_PATH, read_manifest, save_model_atomic, validate_model
+
+# ========== Model Specs ==========
+# module: training script providing generate_dataset, build_pipeline and the
+# feature lists. system: the app system it serves (None = not served by the app).
+MODEL_SPECS = {
+    "heart": {
+        "module": "train_model",
+        "system": "Heart",
+        "params": {"num_patients": 1000, "seed": 42},
+        "drop": ["PatientID", "CheckupDate"],
+        "artifact": "timeline_model",
+    },
+    "brain": {
+        "module": "train_brain_model_v2",
+        "system": "Brain",
+        "params": {"num_samples": 1200, "seed": 42},
+        "drop": [],
+        "artifact": "brain_model",
+    },
+    "brain_v1": {
+        "module": "train_brain_model",
+        "system": None,
+        "params": {"num_samples": 1000, "seed": 42},
+        "drop": [],
+        "artifact": "brain_model_v1",
+    },
+}
+
+
+# ========== Worker ==========
+def new_version():
+    # Timestamp for ordering plus the pid, so runs started in the same second
+    # never write to the same artifact names
+    return f"{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}"
+
+
+def train_one(name, output_dir, backend=DEFAULT_BACKEND, version=None):
+    # Runs in a worker process; returns the manifest entry for the new artifact
+    spec = MODEL_SPECS[name]
+    module = importlib.import_module(spec["module"])
+    start = time.perf_counter()
+    df, dataset_key = cached_dataset(module.generate_dataset, **spec["params"])
+    data_seconds = time.perf_counter() - start
+
+    X = df.drop(columns=spec["drop"] + [module.LABEL])
+    y = df[module.LABEL]
+    pipeline = module.build_pipeline(backend)
+    start = time.perf_counter()
+    pipeline.fit(X, y)
+    fit_seconds = time.perf_counter() - start
+    if spec["system"]:
+        validate_model(spec["system"], pipeline)
+
+    version = version or new_version()
+    artifact = f"{spec['artifact']}-{version}.pkl"
+    path = os.path.join(output_dir, artifact)
+    save_model_atomic(pipeline, path)
+    save_reference(X, module.NUMERIC_FEATURES, module.CATEGORICAL_FEATURES, path,
+                   resolution=getattr(module, "INPUT_RESOLUTION", None))
+    return {
+        "system": spec["system"],
+        "artifact": artifact,
+        "drift_reference": os.path.basename(reference_path(path)),
+        "version": version,
+        "backend": backend,
+        "dataset": dataset_key,
+        "rows": len(X),
+        "classes": [str(c) for c in pipeline.classes_],
+        "trained_at": datetime.now().isoformat(timespec="seconds"),
+        "data_seconds": data_seconds,
+        "fit_seconds": fit_seconds,
+    }
+
+
+# ========== Manifest ==========
+def write_manifest(entries, manifest_path=MANIFEST_PATH):
+    # Entries for models not retrained this run are carried over
+    models = read_manifest(manifest_path)["models"] if os.path.exists(manifest_path) else {}
+    models.update(entries)
+    manifest = {"updated_at": datetime.now().isoformat(timespec="seconds"), "models": models}
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
+
+def prune_artifacts(output_dir, manifest, keep=3):
+    # Keep the newest `keep` versions of each artifact, never the ones in the manifest
+    live = {entry["artifact"] for entry in manifest["models"].values()}
+    removed = []
+    for spec in MODEL_SPECS.values():
+        prefix = spec["artifact"] + "-"
+        versions = sorted((n for n in os.listdir(output_dir) if n.startswith(prefix) and n.endswith(".pkl")
+                           and n[len(prefix):-len(".pkl")][:1].isdigit()), reverse=True)
+        for name in versions[keep:]:
+            if name in live:
+                continue
+            path = os.path.join(output_dir, name)
+            for stale in (path, reference_path(path)):
+                if os.path.exists(stale):
+                    os.unlink(stale)
+            removed.append(name)
+    return removed
+
+
+def train_all(names=None, backend=DEFAULT_BACKEND, manifest_path=MANIFEST_PATH, workers=None, keep=3):
+    names = list(names or MODEL_SPECS)
+    output_dir = os.path.dirname(manifest_path) or "."
+    os.makedirs(output_dir, exist_ok=True)
+    version = new_version()
+
+    entries, failures = {}, {}
+    with ProcessPoolExecutor(max_workers=workers or len(names)) as pool:
+        futures = {pool.submit(train_one, name, output_dir, backend, version): name for name in names}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                entries[name] = future.result()
+            except Exception as e:
+                failures[name] = f"{type(e).__name__}: {e}"
+
+    # Publish only what trained; a failed model keeps its previous manifest entry
+    manifest = write_manifest(entries, manifest_path) if entries else None
+    removed = prune_artifacts(output_dir, manifest, keep) if manifest else []
+    return entries, failures, removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train all body-system models in parallel and write the manifest.")
+    parser.add_argument("--only", nargs="+", choices=list(MODEL_SPECS), help="train just these models")
+    parser.add_argument("--backend", choices=list(CLASSIFIER_BACKENDS), default=DEFAULT_BACKEND)
+    parser.add_argument("--manifest", default=MANIFEST_PATH)
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per model)")
+    parser.add_argument("--keep", type=int, default=3, help="versions of each artifact to keep on disk")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    entries, failures, removed = train_all(args.only, args.backend, args.manifest, args.workers, args.keep)
+    wall_seconds = time.perf_counter() - start
+
+    print(f"\n🏭 Trained {len(entries)} model(s) in {wall_seconds:.2f}s:")
+    for name, entry in sorted(entries.items()):
+        print(f"{name:<10} {entry['artifact']:<36} {entry['rows']:>8,} rows  "
+              f"data {entry['data_seconds']:6.2f}s  fit {entry['fit_seconds']:6.2f}s")
+    if entries:
+        serial = sum(e["data_seconds"] + e["fit_seconds"] for e in entries.values())
+        print(f"Sum of per-model times: {serial:.2f}s")
+        print(f"📄 Manifest written to {args.manifest}")
+    if removed:
+        print(f"🧹 Removed {len(removed)} old artifact version(s)")
+    for name, error in failures.items():
+        print(f"❌ {name}: {error}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,64 +1,92 @@
-
+import argparse
 import pandas as pd
 import numpy as np
 from sklearn.pipeline import Pipeline
-from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler, OneHotEncoder
 from sklearn.compose import ColumnTransformer
-import joblib
+from classifier_backends import DEFAULT_BACKEND, add_backend_arguments, build_leaderboard, make_classifier, report_leaderboard
+from dataset_cache import cached_dataset
+from drift_monitor import save_reference
+from model_manager import save_model_atomic
+from training_profiler import TrainingProfiler, add_profile_arguments
 
-# Set seed
-np.random.seed(42)
+# Define feature types
+NUMERIC_FEATURES = ['Age', 'BP_Systolic', 'BP_Diastolic', 'StressLevel']
+CATEGORICAL_FEATURES = ['Sex', 'HasHypertension', 'Smokes', 'BlurredVision',
+                        'FrequentHeadaches', 'MobilityDizziness', 'FamilyHistoryBrainEvent']
+LABEL = 'RiskLabel'
 
-# Generate synthetic data
-num_samples = 1000
-df = pd.DataFrame({
-    'Age': np.random.randint(30, 80, size=num_samples),
-    'Sex': np.random.choice(['Male', 'Female'], size=num_samples),
-    'BP_Systolic': np.random.randint(110, 200, size=num_samples),
-    'BP_Diastolic': np.random.randint(70, 120, size=num_samples),
-    'HasHypertension': np.random.choice([0, 1], size=num_samples, p=[0.4, 0.6]),
-    'StressLevel': np.random.randint(1, 11, size=num_samples),
-    'Smokes': np.random.choice([0, 1], size=num_samples, p=[0.7, 0.3]),
-    'BlurredVision': np.random.choice([0, 1], size=num_samples, p=[0.85, 0.15]),
-    'FrequentHeadaches': np.random.choice([0, 1], size=num_samples, p=[0.8, 0.2]),
-    'MobilityDizziness': np.random.choice([0, 1], size=num_samples, p=[0.9, 0.1]),
-    'FamilyHistoryBrainEvent': np.random.choice([0, 1], size=num_samples, p=[0.75, 0.25])
-})
 
-# Define labels based on logic
-conditions = (
-    (df['BP_Systolic'] > 160) & 
-    (df['StressLevel'] > 7) & 
-    ((df['BlurredVision'] == 1) | (df['FrequentHeadaches'] == 1) | (df['MobilityDizziness'] == 1))
-)
+def generate_dataset(num_samples=1000, seed=42):
+    # Set seed
+    np.random.seed(seed)
 
-df['RiskLabel'] = np.where(conditions, 'EmergencyRisk', 
-                           np.where((df['HasHypertension'] == 1) | (df['StressLevel'] >= 6), 'Warning', 'NoRisk'))
+    # Generate synthetic data
+    df = pd.DataFrame({
+        'Age': np.random.randint(30, 80, size=num_samples),
+        'Sex': np.random.choice(['Male', 'Female'], size=num_samples),
+        'BP_Systolic': np.random.randint(110, 200, size=num_samples),
+        'BP_Diastolic': np.random.randint(70, 120, size=num_samples),
+        'HasHypertension': np.random.choice([0, 1], size=num_samples, p=[0.4, 0.6]),
+        'StressLevel': np.random.randint(1, 11, size=num_samples),
+        'Smokes': np.random.choice([0, 1], size=num_samples, p=[0.7, 0.3]),
+        'BlurredVision': np.random.choice([0, 1], size=num_samples, p=[0.85, 0.15]),
+        'FrequentHeadaches': np.random.choice([0, 1], size=num_samples, p=[0.8, 0.2]),
+        'MobilityDizziness': np.random.choice([0, 1], size=num_samples, p=[0.9, 0.1]),
+        'FamilyHistoryBrainEvent': np.random.choice([0, 1], size=num_samples, p=[0.75, 0.25])
+    })
 
-X = df.drop(columns=['RiskLabel'])
-y = df['RiskLabel']
+    # Define labels based on logic
+    conditions = (
+        (df['BP_Systolic'] > 160) & 
+        (df['StressLevel'] > 7) & 
+        ((df['BlurredVision'] == 1) | (df['FrequentHeadaches'] == 1) | (df['MobilityDizziness'] == 1))
+    )
+
+    df[LABEL] = np.where(conditions, 'EmergencyRisk', 
+                         np.where((df['HasHypertension'] == 1) | (df['StressLevel'] >= 6), 'Warning', 'NoRisk'))
+    return df
+
+
+def build_pipeline(backend=DEFAULT_BACKEND, seed=42):
+    # Preprocessing
+    preprocessor = ColumnTransformer([
+        ('num', StandardScaler(), NUMERIC_FEATURES),
+        ('cat', OneHotEncoder(drop='first'), CATEGORICAL_FEATURES)
+    ])
+
+    # Pipeline
+    return Pipeline([
+        ('preprocessor', preprocessor),
+        ('classifier', make_classifier(backend, seed))
+    ])
 
-# Define feature types
-numeric_features = ['Age', 'BP_Systolic', 'BP_Diastolic', 'StressLevel']
-categorical_features = ['Sex', 'HasHypertension', 'Smokes', 'BlurredVision',
-                        'FrequentHeadaches', 'MobilityDizziness', 'FamilyHistoryBrainEvent']
 
-# Preprocessing
-preprocessor = ColumnTransformer([
-    ('num', StandardScaler(), numeric_features),
-    ('cat', OneHotEncoder(drop='first'), categorical_features)
-])
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the original brain risk model.")
+    add_backend_arguments(parser)
+    add_profile_arguments(parser, default_rows=1000)
+    args = parser.parse_args()
+    profiler = TrainingProfiler(enabled=args.profile, trace_allocations=args.trace_allocations,
+                                per_tree=args.per_tree)
 
-# Pipeline
-pipeline = Pipeline([
-    ('preprocessor', preprocessor),
-    ('classifier', RandomForestClassifier(n_estimators=100, random_state=42))
-])
+    with profiler.phase("generate") as phase:
+        df, _ = cached_dataset(generate_dataset, args.rows)
+        # A cache hit times loading, not generation
+        phase["dataset_cache"] = df.attrs["dataset_cache"]
+    X = df.drop(columns=[LABEL])
+    y = df[LABEL]
 
-# Train
-pipeline.fit(X, y)
+    if args.leaderboard:
+        report_leaderboard(build_leaderboard(build_pipeline, X, y), "brain_model_v1.pkl")
+    else:
+        # Train
+        pipeline = build_pipeline(args.backend)
+        profiler.fit(pipeline, X, y)
 
-# Save model
-joblib.dump(pipeline, "brain_model.pkl")
-print("✅ Brain model trained and saved as brain_model.pkl")
+        # Save model
+        with profiler.phase("save"):
+            save_model_atomic(pipeline, "brain_model_v1.pkl")
+            save_reference(X, NUMERIC_FEATURES, CATEGORICAL_FEATURES, "brain_model_v1.pkl")
+        print(f"✅ Brain model ({args.backend}) trained and saved as brain_model_v1.pkl")
+        profiler.save("brain_model_v1.pkl")
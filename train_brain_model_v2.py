@@ -1,81 +1,117 @@
-
+import argparse
 import pandas as pd
 import numpy as np
 from sklearn.pipeline import Pipeline
-from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler, OneHotEncoder
 from sklearn.compose import ColumnTransformer
-import joblib
-
-# Seed
-np.random.seed(42)
-
-# Sample size
-num_samples = 1200
-
-# Generate dataset with clinical readings + symptom flags
-df = pd.DataFrame({
-    'Age': np.random.randint(30, 80, size=num_samples),
-    'Sex': np.random.choice(['Male', 'Female'], size=num_samples),
-    'BP_Systolic': np.random.randint(110, 200, size=num_samples),
-    'BP_Diastolic': np.random.randint(70, 120, size=num_samples),
-    'RestingHR': np.random.randint(55, 110, size=num_samples),
-    'SpO2': np.random.normal(97, 1.5, size=num_samples).clip(90, 100),
-    'FastingBloodSugar': np.random.randint(70, 180, size=num_samples),
-    'BMI': np.random.normal(26, 4, size=num_samples).clip(16, 40),
-    'StressLevel': np.random.randint(1, 11, size=num_samples),
-    'Smokes': np.random.choice([0, 1], size=num_samples, p=[0.7, 0.3]),
-    'BlurredVision': np.random.choice([0, 1], size=num_samples, p=[0.85, 0.15]),
-    'FrequentHeadaches': np.random.choice([0, 1], size=num_samples, p=[0.8, 0.2]),
-    'MobilityDizziness': np.random.choice([0, 1], size=num_samples, p=[0.9, 0.1]),
-    'FamilyHistoryBrainEvent': np.random.choice([0, 1], size=num_samples, p=[0.75, 0.25])
-})
-
-# Label rules (smarter logic)
-conditions = (
-    (df['BP_Systolic'] >= 170) |
-    (df['SpO2'] <= 93) |
-    (df['FastingBloodSugar'] >= 160) |
-    (df['RestingHR'] >= 100) |
-    ((df['BlurredVision'] == 1) & (df['StressLevel'] >= 7)) |
-    ((df['MobilityDizziness'] == 1) & (df['BMI'] >= 32))
-)
-
-df['RiskLabel'] = np.where(
-    conditions, 'EmergencyRisk',
-    np.where(
-        (df['StressLevel'] >= 6) |
-        (df['BMI'] >= 28) |
-        (df['BP_Systolic'] >= 145) |
-        (df['FastingBloodSugar'] >= 130),
-        'Warning',
-        'NoRisk'
+from classifier_backends import DEFAULT_BACKEND, add_backend_arguments, build_leaderboard, make_classifier, report_leaderboard
+from dataset_cache import cached_dataset
+from drift_monitor import check_reference, load_reference, reference_path, save_reference
+from model_manager import save_model_atomic
+from training_profiler import TrainingProfiler, add_profile_arguments
+
+# Define numeric & categorical features
+NUMERIC_FEATURES = ['Age', 'BP_Systolic', 'BP_Diastolic', 'RestingHR', 'SpO2', 'FastingBloodSugar', 'BMI', 'StressLevel']
+CATEGORICAL_FEATURES = ['Sex', 'Smokes', 'BlurredVision', 'FrequentHeadaches', 'MobilityDizziness', 'FamilyHistoryBrainEvent']
+LABEL = 'RiskLabel'
+# Step of the app's input for features generated here as continuous values, so
+# the drift reference matches what live inputs can look like
+INPUT_RESOLUTION = {'SpO2': 1}
+
+
+def generate_dataset(num_samples=1200, seed=42):
+    # Seed
+    np.random.seed(seed)
+
+    # Generate dataset with clinical readings + symptom flags
+    df = pd.DataFrame({
+        'Age': np.random.randint(30, 80, size=num_samples),
+        'Sex': np.random.choice(['Male', 'Female'], size=num_samples),
+        'BP_Systolic': np.random.randint(110, 200, size=num_samples),
+        'BP_Diastolic': np.random.randint(70, 120, size=num_samples),
+        'RestingHR': np.random.randint(55, 110, size=num_samples),
+        'SpO2': np.random.normal(97, 1.5, size=num_samples).clip(90, 100),
+        'FastingBloodSugar': np.random.randint(70, 180, size=num_samples),
+        'BMI': np.random.normal(26, 4, size=num_samples).clip(16, 40),
+        'StressLevel': np.random.randint(1, 11, size=num_samples),
+        'Smokes': np.random.choice([0, 1], size=num_samples, p=[0.7, 0.3]),
+        'BlurredVision': np.random.choice([0, 1], size=num_samples, p=[0.85, 0.15]),
+        'FrequentHeadaches': np.random.choice([0, 1], size=num_samples, p=[0.8, 0.2]),
+        'MobilityDizziness': np.random.choice([0, 1], size=num_samples, p=[0.9, 0.1]),
+        'FamilyHistoryBrainEvent': np.random.choice([0, 1], size=num_samples, p=[0.75, 0.25])
+    })
+
+    # Label rules (smarter logic)
+    conditions = (
+        (df['BP_Systolic'] >= 170) |
+        (df['SpO2'] <= 93) |
+        (df['FastingBloodSugar'] >= 160) |
+        (df['RestingHR'] >= 100) |
+        ((df['BlurredVision'] == 1) & (df['StressLevel'] >= 7)) |
+        ((df['MobilityDizziness'] == 1) & (df['BMI'] >= 32))
     )
-)
 
-# Train/test split
-X = df.drop(columns=['RiskLabel'])
-y = df['RiskLabel']
+    df[LABEL] = np.where(
+        conditions, 'EmergencyRisk',
+        np.where(
+            (df['StressLevel'] >= 6) |
+            (df['BMI'] >= 28) |
+            (df['BP_Systolic'] >= 145) |
+            (df['FastingBloodSugar'] >= 130),
+            'Warning',
+            'NoRisk'
+        )
+    )
+    return df
 
-# Define numeric & categorical features
-numeric_features = ['Age', 'BP_Systolic', 'BP_Diastolic', 'RestingHR', 'SpO2', 'FastingBloodSugar', 'BMI', 'StressLevel']
-categorical_features = ['Sex', 'Smokes', 'BlurredVision', 'FrequentHeadaches', 'MobilityDizziness', 'FamilyHistoryBrainEvent']
-
-# Preprocessing
-preprocessor = ColumnTransformer([
-    ('num', StandardScaler(), numeric_features),
-    ('cat', OneHotEncoder(drop='first'), categorical_features)
-])
-
-# Pipeline
-pipeline = Pipeline([
-    ('preprocessor', preprocessor),
-    ('classifier', RandomForestClassifier(n_estimators=100, random_state=42))
-])
-
-# Train
-pipeline.fit(X, y)
-
-# Save
-joblib.dump(pipeline, "brain_model.pkl")
-print("✅ Smart Brain model with clinical data saved as brain_model.pkl")
+
+def build_pipeline(backend=DEFAULT_BACKEND, seed=42):
+    # Preprocessing
+    preprocessor = ColumnTransformer([
+        ('num', StandardScaler(), NUMERIC_FEATURES),
+        ('cat', OneHotEncoder(drop='first'), CATEGORICAL_FEATURES)
+    ])
+
+    # Pipeline
+    return Pipeline([
+        ('preprocessor', preprocessor),
+        ('classifier', make_classifier(backend, seed))
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the smart brain risk model.")
+    add_backend_arguments(parser)
+    add_profile_arguments(parser, default_rows=1200)
+    args = parser.parse_args()
+    profiler = TrainingProfiler(enabled=args.profile, trace_allocations=args.trace_allocations,
+                                per_tree=args.per_tree)
+
+    with profiler.phase("generate") as phase:
+        df, _ = cached_dataset(generate_dataset, args.rows)
+        # A cache hit times loading, not generation
+        phase["dataset_cache"] = df.attrs["dataset_cache"]
+
+    # Train/test split
+    X = df.drop(columns=[LABEL])
+    y = df[LABEL]
+
+    if args.leaderboard:
+        report_leaderboard(build_leaderboard(build_pipeline, X, y), "brain_model.pkl")
+    else:
+        # Train
+        pipeline = build_pipeline(args.backend)
+        profiler.fit(pipeline, X, y)
+
+        # Save
+        with profiler.phase("save"):
+            save_model_atomic(pipeline, "brain_model.pkl")
+            save_reference(X, NUMERIC_FEATURES, CATEGORICAL_FEATURES, "brain_model.pkl", resolution=INPUT_RESOLUTION)
+        print(f"✅ Smart Brain model ({args.backend}) with clinical data saved as brain_model.pkl")
+
+        # Fresh in-distribution inputs must not trip the drift alert
+        noisy = check_reference(load_reference(reference_path("brain_model.pkl")),
+                                generate_dataset(num_samples=1000, seed=7), INPUT_RESOLUTION)
+        if noisy:
+            print(f"⚠️ Drift reference alerts on in-distribution inputs: {noisy}")
+        profiler.save("brain_model.pkl")
@@ -0,0 +1,179 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Out-of-core training: streams a CSV/Parquet dataset from disk in chunks so peak
+# memory depends on the chunk size, not on the size of the cohort.
+#
+#   python train_out_of_core.py brain cohort.csv --chunksize 100000
+#   python train_out_of_core.py brain cohort.csv --generate 5000000
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import KBinsDiscretizer, OneHotEncoder, StandardScaler
+
+import train_brain_model_v2
+import train_model
+from drift_monitor import CategoricalSketch, at_resolution, numeric_sketch, write_reference
+from model_manager import MODEL_SCHEMAS, save_model_atomic
+
+# ========== Training Specs ==========
+TRAINING_SPECS = {
+    "brain": {
+        "features": MODEL_SCHEMAS["Brain"],
+        "numeric": train_brain_model_v2.NUMERIC_FEATURES,
+        "categorical": train_brain_model_v2.CATEGORICAL_FEATURES,
+        "label": train_brain_model_v2.LABEL,
+        "resolution": train_brain_model_v2.INPUT_RESOLUTION,
+        "generate": lambda n, seed: train_brain_model_v2.generate_dataset(num_samples=n, seed=seed),
+        "output": "brain_model_ooc.pkl",
+    },
+    "heart": {
+        "features": MODEL_SCHEMAS["Heart"],
+        "numeric": train_model.NUMERIC_FEATURES,
+        "categorical": train_model.CATEGORICAL_FEATURES,
+        "label": train_model.LABEL,
+        "resolution": {},
+        "generate": lambda n, seed: train_model.generate_dataset(num_patients=n, seed=seed),
+        "output": "timeline_model_ooc.pkl",
+    },
+}
+
+
+# ========== Chunk Readers ==========
+def iter_chunks(path, columns, chunksize):
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet files requires pyarrow: pip install pyarrow")
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize)
+
+
+def write_synthetic_dataset(spec, path, num_rows, chunksize, seed=42):
+    # Write the synthetic cohort one chunk at a time so generating it is also bounded
+    columns = spec["features"] + [spec["label"]]
+    written = 0
+    chunk_index = 0
+    while written < num_rows:
+        n = min(chunksize, num_rows - written)
+        chunk = spec["generate"](n, seed + chunk_index)[columns]
+        chunk.to_csv(path, mode="w" if chunk_index == 0 else "a", header=chunk_index == 0, index=False)
+        written += len(chunk)
+        chunk_index += 1
+    return written
+
+
+# ========== Streaming Fit ==========
+def collect_statistics(spec, path, chunksize):
+    # First pass: running mean/variance and range for numeric columns, category and class sets
+    scaler = StandardScaler()
+    lows, highs = None, None
+    categories = {col: set() for col in spec["categorical"]}
+    classes = set()
+    rows = 0
+    for chunk in iter_chunks(path, spec["features"] + [spec["label"]], chunksize):
+        scaler.partial_fit(chunk[spec["numeric"]])
+        chunk_low, chunk_high = chunk[spec["numeric"]].min(), chunk[spec["numeric"]].max()
+        lows = chunk_low if lows is None else np.minimum(lows, chunk_low)
+        highs = chunk_high if highs is None else np.maximum(highs, chunk_high)
+        for col in spec["categorical"]:
+            categories[col].update(chunk[col].dropna().unique().tolist())
+        classes.update(chunk[spec["label"]].unique().tolist())
+        rows += len(chunk)
+    if rows == 0:
+        raise ValueError(f"No rows found in {path}")
+    ranges = pd.DataFrame([lows, highs])
+    return scaler, ranges, {col: sorted(values) for col, values in categories.items()}, sorted(classes), rows
+
+
+def build_preprocessor(spec, scaler, ranges, categories, sample, n_bins=32):
+    # Uniform histogram bins over the streamed min/max let the linear model pick
+    # up the threshold-style effects that the forest learns from splits.
+    binner = KBinsDiscretizer(n_bins=n_bins, encode='onehot', strategy='uniform')
+    encoder = OneHotEncoder(categories=[categories[col] for col in spec["categorical"]], drop='first')
+    preprocessor = ColumnTransformer([
+        ('num', StandardScaler(), spec["numeric"]),
+        ('bins', binner, spec["numeric"]),
+        ('cat', encoder, spec["categorical"])
+    ])
+    # Fit on one chunk plus two rows holding the streamed min/max, so the uniform
+    # bin edges cover the whole dataset. The encoder categories are explicit, and
+    # the scaler is replaced by the one fitted on the whole stream.
+    extremes = sample[spec["features"]].iloc[[0, 0]].copy()
+    extremes[spec["numeric"]] = ranges[spec["numeric"]].to_numpy()
+    preprocessor.fit(pd.concat([sample[spec["features"]], extremes]))
+    preprocessor.transformers_[0] = ('num', scaler, spec["numeric"])
+    return preprocessor
+
+
+def train_out_of_core(spec, path, chunksize=100_000, epochs=5, n_bins=32, seed=42):
+    scaler, ranges, categories, classes, rows = collect_statistics(spec, path, chunksize)
+
+    preprocessor = None
+    classifier = SGDClassifier(loss="log_loss", alpha=1e-5, random_state=seed)
+    rng = np.random.RandomState(seed)
+
+    # Drift reference sketches over the streamed ranges, filled during the first epoch
+    resolution = spec["resolution"]
+    sketches = {col: numeric_sketch(*ranges[col], step=resolution.get(col)) for col in spec["numeric"]}
+    sketches.update({col: CategoricalSketch(categories[col]) for col in spec["categorical"]})
+
+    # Remaining passes: incremental fit of the classifier, one chunk in memory at a time
+    for epoch in range(epochs):
+        for chunk in iter_chunks(path, spec["features"] + [spec["label"]], chunksize):
+            if preprocessor is None:
+                preprocessor = build_preprocessor(spec, scaler, ranges, categories, chunk, n_bins)
+            if epoch == 0:
+                for col, sketch in sketches.items():
+                    values = chunk[col].to_numpy()
+                    sketch.update_many(at_resolution(values, resolution[col]) if col in resolution else values)
+            order = rng.permutation(len(chunk))
+            X = preprocessor.transform(chunk[spec["features"]].iloc[order])
+            y = chunk[spec["label"]].to_numpy()[order]
+            classifier.partial_fit(X, y, classes=classes)
+
+    pipeline = Pipeline([
+        ('preprocessor', preprocessor),
+        ('classifier', classifier)
+    ])
+    return pipeline, sketches, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train a body-system model from an on-disk dataset in chunks.")
+    parser.add_argument("system", choices=sorted(TRAINING_SPECS))
+    parser.add_argument("dataset", help="CSV or Parquet file with the feature and label columns")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--bins", type=int, default=32, help="histogram bins per numeric feature")
+    parser.add_argument("--generate", type=int, metavar="ROWS",
+                        help="write a synthetic CSV dataset of this many rows to DATASET first")
+    parser.add_argument("--output", help="model path (defaults to <artifact>_ooc.pkl, leaving the live model untouched)")
+    args = parser.parse_args()
+
+    spec = TRAINING_SPECS[args.system]
+    if args.generate:
+        if os.path.exists(args.dataset):
+            raise FileExistsError(f"Refusing to overwrite existing dataset '{args.dataset}'")
+        written = write_synthetic_dataset(spec, args.dataset, args.generate, args.chunksize)
+        print(f"📝 Wrote {written:,} synthetic rows to {args.dataset}")
+
+    pipeline, sketches, rows = train_out_of_core(spec, args.dataset, args.chunksize, args.epochs, args.bins)
+    output = args.output or spec["output"]
+    save_model_atomic(pipeline, output)
+    write_reference(sketches, output)
+    print(f"✅ {args.system.title()} model trained on {rows:,} rows in chunks of {args.chunksize:,} and saved as {output}")
+
+
+if __name__ == "__main__":
+    main()
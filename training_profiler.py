@@ -0,0 +1,220 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Instrumented training for the train_*.py scripts: wall time and peak memory
+# per phase (data generation, preprocessing, classifier fit, saving), written as
+# <model>_profile.json next to the saved model. --per-tree adds fit time per tree
+# from a separate warm_start refit, kept out of the phase timings.
+#
+#   python train_brain_model_v2.py --profile --rows 200000
+
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    # Windows: no getrusage, memory figures are reported as unavailable
+    resource = None
+
+import numpy as np
+import sklearn
+from sklearn.base import clone
+from sklearn.ensemble import BaseEnsemble
+
+
+# Memory readers return None where the platform does not expose the figure
+# (no /proc on macOS and Windows, no resource module on Windows).
+def current_rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def process_peak_rss_mb():
+    # ru_maxrss is never reset: the peak of the whole run so far
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def peak_rss_mb():
+    # VmHWM follows reset_peak_rss(); the process peak is the fallback
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return process_peak_rss_mb()
+
+
+def format_mb(value, spec="8.1f"):
+    # Fixed-width MB figure, or "n/a" padded to the same width
+    if value is None:
+        return "n/a".rjust(len(format(0.0, spec)))
+    return format(value, spec)
+
+
+def reset_peak_rss():
+    # Writing 5 to clear_refs resets VmHWM to the current RSS (Linux >= 4.0).
+    # Returns False where that is unavailable and the peak stays process-wide.
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def profile_path(model_path):
+    return os.path.splitext(model_path)[0] + "_profile.json"
+
+
+def add_profile_arguments(parser, default_rows):
+    parser.add_argument("--profile", action="store_true",
+                        help="record time and memory per training phase")
+    parser.add_argument("--trace-allocations", action="store_true",
+                        help="also record traced peak allocations per phase (slows training noticeably)")
+    parser.add_argument("--per-tree", action="store_true",
+                        help="also time each tree in a second, warm_start fit after the timed phases")
+    parser.add_argument("--rows", type=int, default=default_rows, help="size of the generated training cohort")
+
+
+class TrainingProfiler:
+    # With enabled=False every method falls through to plain training, so the
+    # scripts use one code path whether or not --profile is given.
+
+    def __init__(self, enabled=True, trace_allocations=False, per_tree=False):
+        self.enabled = enabled
+        self.trace_allocations = enabled and trace_allocations
+        self.per_tree = enabled and per_tree
+        self.phases = []
+        self.tree_seconds = []
+        self.info = {}
+        self._start = time.perf_counter()
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name):
+        # Yields a dict whose entries are added to the phase record
+        extra = {}
+        if not self.enabled:
+            yield extra
+            return
+        if self.trace_allocations:
+            tracemalloc.reset_peak()
+        peak_reset = reset_peak_rss()
+        rss_before = current_rss_mb()
+        start = time.perf_counter()
+        try:
+            yield extra
+        finally:
+            seconds = time.perf_counter() - start
+            # With the high-water mark reset, peak_rss_mb is this phase's peak;
+            # otherwise it is the process peak so far. tracemalloc, when enabled,
+            # sees the Python and numpy allocations made during the phase.
+            rss_after = current_rss_mb()
+            record = {
+                "phase": name,
+                "seconds": seconds,
+                "rss_delta_mb": rss_after - rss_before if rss_after is not None and rss_before is not None else None,
+                "peak_rss_mb": peak_rss_mb(),
+                "peak_scope": "phase" if peak_reset else "process",
+            }
+            if self.trace_allocations:
+                record["peak_traced_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            record.update(extra)
+            self.phases.append(record)
+
+    def fit(self, pipeline, X, y):
+        if not self.enabled:
+            return pipeline.fit(X, y)
+        self.info.update({"rows": len(X), "input_columns": X.shape[1]})
+
+        # Same steps as Pipeline.fit, timed separately
+        *transformers, (_, classifier) = pipeline.steps
+        Xt = X
+        with self.phase("preprocess"):
+            for _, transformer in transformers:
+                Xt = transformer.fit_transform(Xt, y)
+        self.info["encoded_columns"] = Xt.shape[1]
+
+        start = time.perf_counter()
+        with self.phase("fit"):
+            classifier.fit(Xt, y)
+        if hasattr(classifier, "tree_"):
+            self.tree_seconds.append(time.perf_counter() - start)
+        elif self.per_tree and isinstance(classifier, BaseEnsemble) and hasattr(classifier, "warm_start"):
+            self._fit_per_tree(clone(classifier), Xt, y)
+        self.info["classifier"] = type(classifier).__name__
+        return pipeline
+
+    def _fit_per_tree(self, forest, X, y):
+        # warm_start grows a throwaway copy of the forest one tree at a time.
+        # Each call re-validates X and rebuilds the estimator list, so these
+        # timings sum to well above the "fit" phase; compare trees, not totals.
+        forest.set_params(warm_start=True, n_jobs=1)
+        for n in range(1, forest.n_estimators + 1):
+            forest.set_params(n_estimators=n)
+            start = time.perf_counter()
+            forest.fit(X, y)
+            self.tree_seconds.append(time.perf_counter() - start)
+
+    def report(self):
+        report = {
+            "python": platform.python_version(),
+            "sklearn": sklearn.__version__,
+            "total_seconds": time.perf_counter() - self._start,
+            "peak_rss_mb": process_peak_rss_mb(),
+        }
+        report.update(self.info)
+        report["phases"] = self.phases
+        if self.tree_seconds:
+            seconds = np.asarray(self.tree_seconds)
+            report["trees"] = {
+                "count": len(seconds),
+                "method": "warm_start_refit" if len(seconds) > 1 else "single_fit",
+                "total_seconds": float(seconds.sum()),
+                "mean_seconds": float(seconds.mean()),
+                "p95_seconds": float(np.percentile(seconds, 95)),
+                "max_seconds": float(seconds.max()),
+                "per_tree_seconds": seconds.tolist(),
+            }
+        return report
+
+    def save(self, model_path):
+        if not self.enabled:
+            return None
+        report = self.report()
+        path = profile_path(model_path)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp_path, path)
+        if self.trace_allocations:
+            tracemalloc.stop()
+
+        print(f"\n⏱️ Training profile ({report.get('rows', 0):,} rows):")
+        for phase in report["phases"]:
+            traced = f"  peak traced {phase['peak_traced_mb']:8.1f} MB" if "peak_traced_mb" in phase else ""
+            cache = f"  (dataset cache {phase['dataset_cache']})" if "dataset_cache" in phase else ""
+            print(f"{phase['phase']:<10} {phase['seconds']:8.2f}s  RSS {format_mb(phase['rss_delta_mb'], '+8.1f')} MB  "
+                  f"{phase['peak_scope']} peak {format_mb(phase['peak_rss_mb'])} MB{traced}{cache}")
+        if "trees" in report:
+            trees = report["trees"]
+            print(f"trees      {trees['count']} timed ({trees['method']}), mean {trees['mean_seconds'] * 1000:.1f} ms, "
+                  f"p95 {trees['p95_seconds'] * 1000:.1f} ms")
+        print(f"📄 Profile saved as {path}")
+        return path
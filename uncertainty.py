@@ -0,0 +1,159 @@
+# © 2025 Sasi Kiran. All Rights Reserved.
+# Future Health Predictor - Predictive Healthcare & Neurological Risk System
+# Unauthorized use, reproduction, or distribution is prohibited.
+# Per-prediction uncertainty from how much the trees of a forest disagree.
+#
+# score_with_uncertainty() walks each tree once, as
+# RandomForestClassifier.predict_proba does, and accumulates hard votes and
+# squared probabilities next to the probability sum through one per-leaf lookup
+# table. The mean is identical to predict_proba; vote entropy and the spread of
+# the winning class add about 10-15% to its cost. Models without trees fall back to the
+# entropy of their predicted probabilities.
+#
+#   python uncertainty.py cohort.csv --model brain_model.pkl --top 50
+
+import argparse
+import time
+from collections import namedtuple
+
+import joblib
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.ensemble import BaseEnsemble
+
+# Normalized vote entropy (log 3) at which a prediction goes to clinician review;
+# with the votes split over two classes, 0.6 is reached below ~63% tree agreement
+REVIEW_THRESHOLD = 0.6
+
+ScoredBatch = namedtuple("ScoredBatch", ["proba", "prediction", "confidence", "vote_share",
+                                         "vote_entropy", "spread", "uncertainty"])
+
+
+def normalized_entropy(p):
+    # 0 = all mass on one class, 1 = spread evenly over all classes
+    p = np.asarray(p, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(p > 0, p * np.log(p), 0.0)
+    return 0.0 - terms.sum(axis=1) / np.log(p.shape[1]) if p.shape[1] > 1 else np.zeros(len(p))
+
+
+def _split_pipeline(model):
+    steps = getattr(model, "steps", None)
+    if not steps:
+        return None, model
+    return model[:-1], steps[-1][1]
+
+
+def leaf_table(tree):
+    # One row per node: [probabilities | squared probabilities | one-hot vote].
+    # Probabilities are normalized exactly like DecisionTreeClassifier.predict_proba.
+    proba = tree.tree_.value[:, 0, :tree.n_classes_].copy()
+    normalizer = proba.sum(axis=1)[:, np.newaxis]
+    normalizer[normalizer == 0.0] = 1.0
+    proba /= normalizer
+    return np.hstack([proba, proba * proba, np.eye(tree.n_classes_)[proba.argmax(axis=1)]])
+
+
+def score_with_uncertainty(model, X):
+    transform, classifier = _split_pipeline(model)
+    n_trees = len(getattr(classifier, "estimators_", []))
+    if not (isinstance(classifier, BaseEnsemble) and n_trees and hasattr(classifier.estimators_[0], "tree_")):
+        proba = model.predict_proba(X)
+        predicted = proba.argmax(axis=1)
+        rows = np.arange(len(proba))
+        entropy = normalized_entropy(proba)
+        return ScoredBatch(proba, model.classes_[predicted], proba[rows, predicted], None, None, None, entropy)
+
+    Xt = transform.transform(X) if transform is not None else X
+    # Trees expect float32 input; convert once instead of once per tree
+    if sparse.issparse(Xt):
+        Xt = sparse.csr_matrix(Xt, dtype=np.float32)
+    else:
+        Xt = np.ascontiguousarray(Xt, dtype=np.float32)
+
+    k = len(classifier.classes_)
+    sums = np.zeros((Xt.shape[0], 3 * k))
+    for tree in classifier.estimators_:
+        # One apply() and one gather per tree feed the sum, the squares and the votes
+        sums += np.take(leaf_table(tree), tree.tree_.apply(Xt), axis=0, mode="clip")
+    total, squares, votes = sums[:, :k], sums[:, k:2 * k], sums[:, 2 * k:]
+
+    rows = np.arange(Xt.shape[0])
+    proba = total / n_trees
+    predicted = proba.argmax(axis=1)
+    vote_share = votes / n_trees
+    variance = np.maximum(squares[rows, predicted] / n_trees - proba[rows, predicted] ** 2, 0.0)
+    vote_entropy = normalized_entropy(vote_share)
+    return ScoredBatch(proba, classifier.classes_[predicted], proba[rows, predicted], vote_share,
+                       vote_entropy, np.sqrt(variance), vote_entropy)
+
+
+def review_queue(X, scored, top=None, threshold=REVIEW_THRESHOLD):
+    # Most uncertain patients first; `top` caps the queue, `threshold` sets the bar
+    queue = X.reset_index(drop=True).copy()
+    queue["prediction"] = scored.prediction
+    queue["confidence"] = scored.confidence
+    queue["uncertainty"] = scored.uncertainty
+    if scored.spread is not None:
+        queue["tree_spread"] = scored.spread
+    queue = queue[queue["uncertainty"] >= threshold] if threshold is not None else queue
+    queue = queue.sort_values("uncertainty", ascending=False, kind="stable")
+    return queue.head(top) if top else queue
+
+
+def print_uncertainty(model, scored):
+    # `scored` is the ScoredBatch the caller already predicted from
+    label = scored.prediction[0]
+    if scored.vote_share is not None:
+        share = scored.vote_share[0, list(model.classes_).index(label)]
+        print(f"\n🌳 Tree agreement: {share * 100:.0f}% of trees voted {label} "
+              f"(uncertainty {scored.uncertainty[0]:.2f})")
+    else:
+        print(f"\n🌳 Model uncertainty: {scored.uncertainty[0]:.2f}")
+    if scored.uncertainty[0] >= REVIEW_THRESHOLD:
+        print("⚖️ Borderline case — the model is split on this one. Please have a clinician review it.")
+    return scored
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a cohort with per-patient uncertainty and build a review queue.")
+    parser.add_argument("cohort", nargs="?", help="CSV with the model's feature columns")
+    parser.add_argument("--model", default="brain_model.pkl")
+    parser.add_argument("--rows", type=int, default=100_000, help="synthetic brain cohort size when no CSV is given")
+    parser.add_argument("--top", type=int, default=25, help="size of the review queue")
+    parser.add_argument("--threshold", type=float, default=REVIEW_THRESHOLD)
+    parser.add_argument("--output", default="review_queue.csv")
+    args = parser.parse_args()
+
+    model = joblib.load(args.model)
+    if args.cohort:
+        X = pd.read_csv(args.cohort)
+    else:
+        from dataset_cache import cached_dataset
+        from train_brain_model_v2 import generate_dataset
+        X, _ = cached_dataset(generate_dataset, num_samples=args.rows, seed=13)
+    X = X[list(model.feature_names_in_)]
+
+    start = time.perf_counter()
+    model.predict_proba(X)
+    plain_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    scored = score_with_uncertainty(model, X)
+    scored_seconds = time.perf_counter() - start
+
+    queue = review_queue(X, scored, args.top, args.threshold)
+    flagged = int((scored.uncertainty >= args.threshold).sum())
+    print(f"\n🎯 Scored {len(X):,} patients: predict_proba {plain_seconds:.3f}s, "
+          f"with uncertainty {scored_seconds:.3f}s ({(scored_seconds / plain_seconds - 1) * 100:+.0f}%)")
+    print(f"Uncertainty: median {np.median(scored.uncertainty):.3f}, "
+          f"{flagged:,} patients ({flagged / len(X) * 100:.1f}%) at or above {args.threshold}")
+    if len(queue):
+        queue.to_csv(args.output, index=False)
+        print(f"\n⚖️ Review queue (top {len(queue)}):")
+        print(queue[["prediction", "confidence", "uncertainty"]].head(10).to_string(float_format=lambda v: f"{v:.3f}"))
+        print(f"📄 Review queue saved as {args.output}")
+
+
+if __name__ == "__main__":
+    main()